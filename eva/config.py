@@ -5,7 +5,7 @@
 
 # pylint: disable=unused-argument
 import os
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import ValidationInfo, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -31,6 +31,9 @@ class Settings(BaseSettings):
 
     # RAG
     rag_docs_folder: str = "documents"
+    rag_embedding_backend: Literal["sentence_transformers", "onnx"] = (
+        "sentence_transformers"
+    )
 
     # ChromaDB
     chroma_local: bool = True
@@ -42,6 +45,10 @@ class Settings(BaseSettings):
     # FastAPI
     eva_host: str = "0.0.0.0"
     eva_port: int = 8000
+    # more than one worker needs a remote ChromaDB (CHROMA_LOCAL=false):
+    # the local persistent store is not safe for concurrent processes
+    eva_workers: int = 1
+    max_ws_connections: int = 1000
     trusted_origins: str | list[str] = "*"
     trusted_origin_regex: str | None = None
     trusted_hosts: str | list[str] = "*"
@@ -76,9 +83,39 @@ class Settings(BaseSettings):
             return [item for item in value if item]  # pyright: ignore
         return []  # pragma: no cover
 
+    @field_validator("eva_workers")
+    @classmethod
+    def check_workers(cls, value: int, info: ValidationInfo) -> int:
+        """Check that several workers do not share a local ChromaDB.
+
+        Parameters
+        ----------
+        value : int
+            The value
+        info : ValidationInfo
+            The validation info
+
+        Returns
+        -------
+        int
+            The value
+
+        Raises
+        ------
+        ValueError
+            If more than one worker is used with the local ChromaDB.
+        """
+        if value > 1 and info.data.get("chroma_local", True):
+            raise ValueError(
+                "EVA_WORKERS > 1 requires a remote ChromaDB "
+                "(CHROMA_LOCAL=false)"
+            )
+        return value
+
     model_config = SettingsConfigDict(
         env_prefix="",  # No prefix: env vars are e.g. "DATABASE_URL"
-        env_file=os.environ.get("PYDANTIC_ENV_FILE", ".env"),
+        # an empty PYDANTIC_ENV_FILE disables the .env file
+        env_file=os.environ.get("PYDANTIC_ENV_FILE", ".env") or None,
         env_file_encoding="utf-8",
         extra="ignore",  # Ignore extra fields not defined in the model
     )
@@ -9,6 +9,37 @@ import json
 import re
 from typing import Any
 
+import orjson
+
+_PUNCTUATION_SPACING_RE = re.compile(r"([.!?])([A-Za-z0-9])")
+# a JSON object starting with {"segments":
+_SEGMENTS_JSON_RE = re.compile(r'\{"segments":\s*\[.*?\]\s*\}', re.DOTALL)
+
+
+def _loads(text: str) -> Any:
+    """Parse JSON with orjson, falling back to the more lenient json.
+
+    Parameters
+    ----------
+    text : str
+        The JSON text to parse.
+
+    Returns
+    -------
+    Any
+        The parsed JSON.
+
+    Raises
+    ------
+    json.JSONDecodeError
+        If the text is not valid JSON.
+    """
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        # e.g. NaN/Infinity or integers larger than 64 bits
+        return json.loads(text)
+
 
 def clean_and_validate_json(response_text: str) -> dict[str, Any]:
     """Clean, validate, and verify JSON response structure.
@@ -35,7 +66,7 @@ def clean_and_validate_json(response_text: str) -> dict[str, Any]:
     """
     # Try to parse as-is first
     try:
-        data = json.loads(response_text)
+        data = _loads(response_text)
         validate_schema(data)
         return data
     except json.JSONDecodeError:
@@ -64,7 +95,7 @@ def clean_and_validate_json(response_text: str) -> dict[str, Any]:
 
         if first_json_end > 0:
             first_json = response_text[:first_json_end]
-            data = json.loads(first_json)
+            data = _loads(first_json)
             validate_schema(data)
             return data
     except (json.JSONDecodeError, ValueError):
@@ -72,11 +103,9 @@ def clean_and_validate_json(response_text: str) -> dict[str, Any]:
 
     # Try to find JSON using regex as last resort
     try:
-        # Look for JSON pattern starting with {"segments":
-        json_pattern = r'\{"segments":\s*\[.*?\]\s*\}'
-        match = re.search(json_pattern, response_text, re.DOTALL)
+        match = _SEGMENTS_JSON_RE.search(response_text)
         if match:
-            data = json.loads(match.group(0))
+            data = _loads(match.group(0))
             validate_schema(data)
             return data
     except (json.JSONDecodeError, ValueError):
@@ -107,7 +136,7 @@ def fix_spacing_after_punctuation(text: str) -> str:
     str
         The text with fixed spacing after punctuation.
     """
-    return re.sub(r"([.!?])([A-Za-z0-9])", r"\1 \2", text)
+    return _PUNCTUATION_SPACING_RE.sub(r"\1 \2", text)
 
 
 # Optional: Add a repair function for common issues
@@ -40,6 +40,8 @@ class EvaApp(FastAPI):
     db_manager: DatabaseManager
     rag_manager: RAGManager
     llm_manager: LLMManager
+    # websocket connections rejected because of max_ws_connections
+    rejected_connections: int = 0
 
 
 @asynccontextmanager
@@ -66,6 +68,7 @@ async def lifespan(application: EvaApp) -> AsyncIterator[None]:
     yield
     # On shutdown
     await application.db_manager.close()
+    await application.rag_manager.close()
     await application.llm_manager.close()
 
 
@@ -151,6 +154,20 @@ class ChatApplication:
                     code=1008, reason="Invalid or missing API key"
                 )
                 return
+            if len(self.active_connections) >= settings.max_ws_connections:
+                self.app.rejected_connections += 1
+                msg = (
+                    "Rejecting WebSocket connection: %d active connections "
+                    "(limit %d, %d rejected so far)"
+                )
+                self.log.warning(
+                    msg,
+                    len(self.active_connections),
+                    settings.max_ws_connections,
+                    self.app.rejected_connections,
+                )
+                await websocket.close(code=1013, reason="Server busy")
+                return
             await websocket.accept(subprotocol=subprotocol)
             connection_id = str(uuid.uuid4())
             self.active_connections[connection_id] = websocket
@@ -521,6 +538,11 @@ if __name__ == "__main__":
         server_header=False,
         date_header=False,
         forwarded_allow_ips="*",
+        # uvloop is not available on windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
         # ws="wsproto", // it seems that it won't work with subprotocol auth
+        ws="websockets",
+        workers=settings.eva_workers,
     )
     logging.info("EVA application started successfully")
@@ -6,8 +6,6 @@
 from eva.config import settings
 
 from ._base import RAGManager
-from ._chroma_local import ChromaLocalRAGManager
-from ._chroma_remote import ChromaRemoteRAGManager
 
 
 def get_rag_manager() -> RAGManager:  # pragma: no cover
@@ -18,18 +16,25 @@ def get_rag_manager() -> RAGManager:  # pragma: no cover
     RAGManager
         An instance of the RAGManager configured for the application.
     """
+    # chroma is imported on first use, not with every eva.rag module
+    # pylint: disable=import-outside-toplevel
+    from ._chroma_local import ChromaLocalRAGManager
+    from ._chroma_remote import ChromaRemoteRAGManager
+
     # just chroma for now
     if settings.chroma_local is True:
         return ChromaLocalRAGManager(
             persist_directory=settings.chroma_db_dir,
             collection_name=settings.chroma_collection_name,
             documents_root=settings.rag_docs_folder,
+            embedding_backend=settings.rag_embedding_backend,
         )
     return ChromaRemoteRAGManager(
         host=settings.chroma_host,
         port=settings.chroma_port,
         collection_name=settings.chroma_collection_name,
         documents_root=settings.rag_docs_folder,
+        embedding_backend=settings.rag_embedding_backend,
     )
 
 
@@ -6,12 +6,41 @@
 # pyright: reportReturnType=false
 # pylint: disable=no-self-use, broad-exception-caught,too-many-try-statements
 import asyncio
+import itertools
 import logging
+import os
+import secrets
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Protocol
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterator,
+    Mapping,
+    Protocol,
+    Sequence,
+)
 
 from .loader import SUPPORTED_EXTENSIONS, DocumentLoader
 
+# chunk ids: a random per-process prefix and a monotonic counter,
+# instead of reading random bytes for every chunk
+_RUN_PREFIX = secrets.token_hex(4)
+_NEXT_ID = itertools.count()
+
+# collection (HNSW index) settings for bulk ingest: the vectors are
+# indexed in large batches and the index is persisted less often
+HNSW_INGEST_PARAMS: dict[str, Any] = {
+    "hnsw:space": "cosine",
+    "hnsw:construction_ef": 100,
+    "hnsw:M": 16,
+    "hnsw:search_ef": 64,
+    "hnsw:batch_size": 10000,
+    "hnsw:sync_threshold": 100000,
+}
+
 
 class RAGManager(Protocol):
     """Protocol for a RAG manager."""
@@ -31,6 +60,13 @@ class RAGManager(Protocol):
     async def reload_documents(self) -> None:
         """Reload documents into the RAG manager."""
 
+    async def close(self) -> None:
+        """Close the RAG manager.
+
+        This method is called during application shutdown to clean up
+        any resources or connections.
+        """
+
     async def search(
         self, query: str, n_results: int = 3
     ) -> list[dict[str, Any]]:
@@ -60,6 +96,21 @@ class BaseRAGManager(RAGManager):
     def _get_supported_files(self, path: Path) -> list[Path]:
         """Get all supported files from path.
 
+        Parameters
+        ----------
+        path : Path
+            The path to the file or directory.
+        """
+        return list(self._get_supported_files_with_stats(path))
+
+    def _get_supported_files_with_stats(
+        self, path: Path
+    ) -> dict[Path, os.stat_result]:
+        """Get all supported files from path, with their stat results.
+
+        Directories are walked with ``os.scandir``, whose entries
+        already tell the file type, so each file is only stat()ed once.
+
         Parameters
         ----------
         path : Path
@@ -67,16 +118,45 @@ class BaseRAGManager(RAGManager):
         """
         if path.is_file():
             if path.suffix.lower() in SUPPORTED_EXTENSIONS:
-                return [path]  # pragma: no cover
+                return {path: path.stat()}  # pragma: no cover
             self.logger.warning("Unsupported file type: %s", path.suffix)
-            return []
+            return {}
         if path.is_dir():
-            files: list[Path] = []
-            for ext in SUPPORTED_EXTENSIONS:
-                files.extend(path.rglob(f"*{ext}"))
-            return files
+            return dict(self._scan_supported_files(path))
         raise ValueError(f"Invalid path: {path}")
 
+    def _scan_supported_files(
+        self, root: Path
+    ) -> Iterator[tuple[Path, os.stat_result]]:
+        """Recursively find the supported files in a directory.
+
+        Parameters
+        ----------
+        root : Path
+            The directory to walk.
+
+        Yields
+        ------
+        tuple[Path, os.stat_result]
+            The path of each supported file and its stat result.
+        """
+        directories = [root]
+        while directories:
+            directory = directories.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            directories.append(Path(entry.path))
+                        elif (
+                            os.path.splitext(entry.name)[1].lower()
+                            in SUPPORTED_EXTENSIONS
+                            and entry.is_file()
+                        ):
+                            yield Path(entry.path), entry.stat()
+            except OSError as e:
+                self.logger.warning("Could not scan %s: %s", directory, e)
+
     # pylint: disable=too-many-return-statements
     async def a_extract_text_from_file(self, file_path: Path) -> str:
         """Asynchronously extract text content from various file formats.
@@ -114,11 +194,280 @@ class BaseRAGManager(RAGManager):
         str
             The extracted text content from the file.
         """
+        content = self.try_extract_text_from_file(file_path)
+        return "" if content is None else content
+
+    def try_extract_text_from_file(self, file_path: Path) -> str | None:
+        """Extract text content, telling a failure from an empty file.
+
+        Parameters
+        ----------
+        file_path : Path
+            The path to the file to read.
+
+        Returns
+        -------
+        str | None
+            The extracted text content, or None if loading the file failed.
+        """
         try:
             return DocumentLoader.load(file_path)
         except Exception as e:
             self.logger.error("Error loading file %s: %s", file_path, e)
-            return ""
+            return None
+
+    def extract_texts_from_files(self, files: list[Path]) -> list[str]:
+        """Extract the text content of multiple files in parallel.
+
+        Parameters
+        ----------
+        files : list[Path]
+            The paths of the files to read.
+
+        Returns
+        -------
+        list[str]
+            The extracted text contents, in the same order as ``files``.
+        """
+        if not files:
+            return []
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(self.extract_text_from_file, files))
+
+    async def a_extract_texts_from_files(self, files: list[Path]) -> list[str]:
+        """Asynchronously extract the text content of multiple files.
+
+        Parameters
+        ----------
+        files : list[Path]
+            The paths of the files to read.
+
+        Returns
+        -------
+        list[str]
+            The extracted text contents, in the same order as ``files``.
+        """
+        semaphore = asyncio.Semaphore(os.cpu_count() or 4)
+
+        async def _extract(file_path: Path) -> str:
+            async with semaphore:
+                return await self.a_extract_text_from_file(file_path)
+
+        return list(await asyncio.gather(*(_extract(f) for f in files)))
+
+    def iter_texts_from_files(
+        self, files: list[Path]
+    ) -> Iterator[tuple[Path, str | None]]:
+        """Extract the text content of files in parallel, lazily.
+
+        At most twice as many files as worker threads are read ahead,
+        so the extracted texts do not pile up if the consumer is slower.
+
+        Parameters
+        ----------
+        files : list[Path]
+            The paths of the files to read.
+
+        Yields
+        ------
+        tuple[Path, str | None]
+            The file path and its text content (None if loading it failed),
+            in the order of ``files``.
+        """
+        if not files:
+            return
+        workers = os.cpu_count() or 4
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending: deque[tuple[Path, Future[str | None]]] = deque()
+            extract = self.try_extract_text_from_file
+            for file_path in files:
+                pending.append((file_path, executor.submit(extract, file_path)))
+                if len(pending) >= 2 * workers:
+                    done_path, future = pending.popleft()
+                    yield done_path, future.result()
+            while pending:
+                done_path, future = pending.popleft()
+                yield done_path, future.result()
+
+    async def a_iter_texts_from_files(
+        self, files: list[Path]
+    ) -> AsyncIterator[tuple[Path, str]]:
+        """Asynchronously extract the text content of files, lazily.
+
+        Parameters
+        ----------
+        files : list[Path]
+            The paths of the files to read.
+
+        Yields
+        ------
+        tuple[Path, str]
+            The file path and its text content, in the order of ``files``.
+        """
+        window = 2 * (os.cpu_count() or 4)
+        for start in range(0, len(files), window):
+            group = files[start : start + window]
+            contents = await self.a_extract_texts_from_files(group)
+            for file_path, content in zip(group, contents, strict=True):
+                yield file_path, content
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def iter_file_chunks(
+        self,
+        file_path: Path,
+        content: str,
+        chunk_size: int,
+        overlap: int,
+        stat: os.stat_result | None = None,
+    ) -> Iterator[tuple[str, dict[str, Any], str]]:
+        """Split the content of a file into chunks with their metadata.
+
+        Parameters
+        ----------
+        file_path : Path
+            The path of the file.
+        content : str
+            The text content of the file.
+        chunk_size : int
+            The size of each chunk.
+        overlap : int
+            The number of characters to overlap between chunks.
+        stat : os.stat_result | None, optional
+            The stat result of the file, if already known.
+
+        Yields
+        ------
+        tuple[str, dict[str, Any], str]
+            The chunk, its metadata and its id.
+        """
+        # the same for all the chunks of the file
+        if stat is None:
+            stat = file_path.stat()
+        stem = file_path.stem
+        file_metadata: dict[str, Any] = {
+            "source": str(file_path),
+            "file_name": file_path.name,
+            "file_type": file_path.suffix.lower(),
+            "file_size": stat.st_size,
+            "created_at": stat.st_mtime,
+        }
+        chunks = self.split_text(content, chunk_size, overlap)
+        for i, chunk in enumerate(chunks):
+            doc_id = f"{stem}_{i}_{_RUN_PREFIX}{next(_NEXT_ID):08x}"
+            yield chunk, {**file_metadata, "chunk_id": i}, doc_id
+
+    def iter_chunks(
+        self,
+        files: list[Path],
+        chunk_size: int,
+        overlap: int,
+        stats: Mapping[Path, os.stat_result] | None = None,
+        failed: list[Path] | None = None,
+    ) -> Iterator[tuple[str, dict[str, Any], str]]:
+        """Extract and split files into chunks, lazily.
+
+        Parameters
+        ----------
+        files : list[Path]
+            The paths of the files to read.
+        chunk_size : int
+            The size of each chunk.
+        overlap : int
+            The number of characters to overlap between chunks.
+        stats : Mapping[Path, os.stat_result] | None, optional
+            The stat results of the files, if already known.
+        failed : list[Path] | None, optional
+            If given, the files that could not be loaded are appended to it.
+
+        Yields
+        ------
+        tuple[str, dict[str, Any], str]
+            The chunk, its metadata and its id.
+        """
+        stats = stats or {}
+        for file_path, content in self.iter_texts_from_files(files):
+            if content is None and failed is not None:
+                failed.append(file_path)
+            if content:
+                yield from self.iter_file_chunks(
+                    file_path,
+                    content,
+                    chunk_size,
+                    overlap,
+                    stats.get(file_path),
+                )
+
+    async def a_iter_chunks(
+        self,
+        files: list[Path],
+        chunk_size: int,
+        overlap: int,
+        stats: Mapping[Path, os.stat_result] | None = None,
+    ) -> AsyncIterator[tuple[str, dict[str, Any], str]]:
+        """Asynchronously extract and split files into chunks, lazily.
+
+        Parameters
+        ----------
+        files : list[Path]
+            The paths of the files to read.
+        chunk_size : int
+            The size of each chunk.
+        overlap : int
+            The number of characters to overlap between chunks.
+        stats : Mapping[Path, os.stat_result] | None, optional
+            The stat results of the files, if already known.
+
+        Yields
+        ------
+        tuple[str, dict[str, Any], str]
+            The chunk, its metadata and its id.
+        """
+        stats = stats or {}
+        async for file_path, content in self.a_iter_texts_from_files(files):
+            if content:
+                for item in self.iter_file_chunks(
+                    file_path,
+                    content,
+                    chunk_size,
+                    overlap,
+                    stats.get(file_path),
+                ):
+                    yield item
+
+    # pylint: disable=no-self-use
+    def embed_texts(
+        self,
+        embedding_function: Callable[[list[str]], Sequence[Any]],
+        texts: list[str],
+        batch_size: int = 256,
+    ) -> list[Any]:
+        """Compute the embeddings of texts in length-sorted batches.
+
+        Sorting by length keeps similarly sized texts in the same batch,
+        which reduces the padding the embedding model has to process.
+
+        Parameters
+        ----------
+        embedding_function : Callable[[list[str]], Sequence[Any]]
+            The embedding function to use.
+        texts : list[str]
+            The texts to embed.
+        batch_size : int, optional
+            The number of texts to embed per call, by default 256.
+
+        Returns
+        -------
+        list[Any]
+            The embeddings, in the same order as ``texts``.
+        """
+        order = sorted(range(len(texts)), key=lambda index: len(texts[index]))
+        embeddings: list[Any] = [None] * len(texts)
+        for start in range(0, len(order), batch_size):
+            indices = order[start : start + batch_size]
+            batch = embedding_function([texts[index] for index in indices])
+            for index, embedding in zip(indices, batch, strict=True):
+                embeddings[index] = embedding
+        return embeddings
 
     # pylint: disable=no-self-use
     def split_text(self, text: str, chunk_size: int, overlap: int) -> list[str]:
@@ -139,25 +488,31 @@ class BaseRAGManager(RAGManager):
             A list of text chunks.
         """
         chunks: list[str] = []
+        length = len(text)
+        half = chunk_size // 2
         start = 0
 
-        while start < len(text):
+        while start < length:
             end = start + chunk_size
-            chunk = text[start:end]
 
-            if end < len(text):
-                last_period = chunk.rfind(".")
-                last_newline = chunk.rfind("\n")
-                break_point = max(last_period, last_newline)
+            if end < length:
+                # search the original text in place instead of a slice copy
+                break_point = max(
+                    text.rfind(".", start, end), text.rfind("\n", start, end)
+                )
+                # offset in the chunk (-1 if not found)
+                if break_point != -1:
+                    break_point -= start
 
-                if break_point > start + chunk_size // 2:
-                    chunk = text[start : start + break_point + 1]
+                if break_point > start + half:
                     end = start + break_point + 1
 
-            chunks.append(chunk.strip())
+            chunk = text[start:end].strip()
+            if chunk:
+                chunks.append(chunk)
             start = end - overlap
 
-            if start >= len(text):
+            if start >= length:
                 break
 
-        return [chunk for chunk in chunks if chunk]
+        return chunks
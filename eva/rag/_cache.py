@@ -0,0 +1,150 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2025 Thingenious.
+
+"""Approximate (semantic) cache for RAG search results."""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+
+# pylint: disable=too-many-instance-attributes
+@dataclass
+class QueryCache:
+    """Approximate cache of search results keyed by query embeddings.
+
+    A lookup compares the (L2-normalized) query embedding against all
+    cached query embeddings and returns the stored results of the most
+    similar one if its cosine distance is within ``threshold``.
+    The least recently used entry is evicted when ``capacity`` is exceeded.
+
+    Parameters
+    ----------
+    capacity : int
+        Maximum number of cached queries (0 disables the cache).
+    threshold : float
+        Maximum cosine distance for a cached query to be considered a hit.
+    """
+
+    capacity: int = 256
+    threshold: float = 0.05
+    _vectors: npt.NDArray[np.float32] | None = field(default=None, repr=False)
+    _results: list[list[dict[str, Any]]] = field(
+        default_factory=list, repr=False
+    )
+    _n_results: list[int] = field(default_factory=list, repr=False)
+    _last_used: list[int] = field(default_factory=list, repr=False)
+    _clock: int = field(default=0, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def __len__(self) -> int:
+        """Get the number of cached queries.
+
+        Returns
+        -------
+        int
+            The number of cached queries.
+        """
+        return len(self._results)
+
+    def lookup(
+        self, embedding: Sequence[float] | npt.NDArray[Any], n_results: int
+    ) -> list[dict[str, Any]] | None:
+        """Get the cached results of a similar query.
+
+        Parameters
+        ----------
+        embedding : Sequence[float] | npt.NDArray[Any]
+            The embedding of the query.
+        n_results : int
+            The number of requested results.
+
+        Returns
+        -------
+        list[dict[str, Any]] | None
+            The cached results or None on a cache miss.
+        """
+        vector = _normalize(embedding)
+        if vector is None or self.capacity <= 0:
+            return None
+        with self._lock:
+            if self._vectors is None or self._vectors.shape[1] != len(vector):
+                return None
+            similarities = self._vectors @ vector
+            # only entries that hold at least n_results can answer
+            similarities[np.asarray(self._n_results) < n_results] = -np.inf
+            index = int(np.argmax(similarities))
+            if similarities[index] < 1.0 - self.threshold:
+                return None
+            self._clock += 1
+            self._last_used[index] = self._clock
+            return [dict(result) for result in self._results[index][:n_results]]
+
+    def store(
+        self,
+        embedding: Sequence[float] | npt.NDArray[Any],
+        n_results: int,
+        results: list[dict[str, Any]],
+    ) -> None:
+        """Store the results of a query.
+
+        Parameters
+        ----------
+        embedding : Sequence[float] | npt.NDArray[Any]
+            The embedding of the query.
+        n_results : int
+            The number of requested results.
+        results : list[dict[str, Any]]
+            The search results to cache.
+        """
+        vector = _normalize(embedding)
+        if vector is None or self.capacity <= 0:
+            return
+        with self._lock:
+            if self._vectors is not None and self._vectors.shape[1] != len(
+                vector
+            ):
+                self._clear()
+            if self._vectors is not None and len(self._results) >= (
+                self.capacity
+            ):
+                evict = int(np.argmin(self._last_used))
+                self._vectors = np.delete(self._vectors, evict, axis=0)
+                del self._results[evict]
+                del self._n_results[evict]
+                del self._last_used[evict]
+            self._clock += 1
+            self._vectors = (
+                vector[np.newaxis, :]
+                if self._vectors is None
+                else np.vstack([self._vectors, vector])
+            )
+            self._results.append([dict(result) for result in results])
+            self._n_results.append(n_results)
+            self._last_used.append(self._clock)
+
+    def clear(self) -> None:
+        """Remove all the cached entries."""
+        with self._lock:
+            self._clear()
+
+    def _clear(self) -> None:
+        """Remove all the cached entries (lock must be held)."""
+        self._vectors = None
+        self._results.clear()
+        self._n_results.clear()
+        self._last_used.clear()
+
+
+def _normalize(
+    embedding: Sequence[float] | npt.NDArray[Any],
+) -> npt.NDArray[np.float32] | None:
+    """L2-normalize an embedding, None if it cannot be normalized."""
+    vector = np.asarray(embedding, dtype=np.float32).ravel()
+    norm = float(np.linalg.norm(vector))
+    if not vector.size or not np.isfinite(norm) or norm == 0.0:
+        return None
+    return vector / norm
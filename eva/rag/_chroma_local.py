@@ -5,23 +5,54 @@
 
 # pylint: disable=too-many-try-statements,broad-exception-caught,duplicate-code
 import asyncio
-import uuid as uuid_lib
+import os
+from itertools import islice
 from pathlib import Path
 from typing import Any, Optional
 
 import chromadb
-import chromadb.utils.embedding_functions as ef
 from chromadb.api import ClientAPI
 from chromadb.api.models.Collection import Collection  # pyright: ignore
 from chromadb.api.types import EmbeddingFunction, Metadata
 from chromadb.config import Settings
 
-from ._base import BaseRAGManager
-
-
+from ._base import HNSW_INGEST_PARAMS, BaseRAGManager
+from ._cache import QueryCache
+from ._embeddings import EmbeddingBackend, get_embedding_function
+from ._manifest import FileManifest
+
+
+def client_settings(persist_directory: str, persistent: bool) -> Settings:
+    """Get the settings of a local ChromaDB client.
+
+    Parameters
+    ----------
+    persist_directory : str
+        Directory to persist the ChromaDB database.
+    persistent : bool
+        If False, the database is kept in memory only.
+
+    Returns
+    -------
+    Settings
+        The ChromaDB client settings.
+    """
+    settings = Settings(
+        is_persistent=persistent,
+        allow_reset=True,
+        anonymized_telemetry=False,
+    )
+    if persistent:
+        # in-memory clients share one system (and its settings)
+        settings.persist_directory = persist_directory
+    return settings
+
+
+# pylint: disable=too-many-instance-attributes
 class ChromaLocalRAGManager(BaseRAGManager):
     """ChromaDB local RAG Manager implementation."""
 
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     def __init__(
         self,
         local: bool = True,
@@ -30,6 +61,13 @@ class ChromaLocalRAGManager(BaseRAGManager):
         documents_root: str = "documents",
         chunk_size: int = 1000,
         chunk_overlap: int = 200,
+        chunk_batch_size: int = 250,
+        embedding_batch_size: int = 256,
+        query_cache_size: int = 256,
+        query_cache_threshold: float = 0.05,
+        embedding_backend: EmbeddingBackend = "sentence_transformers",
+        hnsw_params: Optional[dict[str, Any]] = None,
+        persistent: bool = True,
     ):
         super().__init__()
         self.local = local
@@ -38,9 +76,19 @@ class ChromaLocalRAGManager(BaseRAGManager):
         self.documents_root = documents_root
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.chunk_batch_size = chunk_batch_size
+        self.embedding_batch_size = embedding_batch_size
+        self.embedding_backend: EmbeddingBackend = embedding_backend
+        self.hnsw_params = {**HNSW_INGEST_PARAMS, **(hnsw_params or {})}
+        # an in-memory collection is not kept after the process exits
+        self.persistent = persistent
         self.collection: Optional[Collection] = None
         self.embedding_function: Optional[EmbeddingFunction[Any]] = None
         self.client: Optional[ClientAPI] = None
+        self.manifest: Optional[FileManifest] = None
+        self.query_cache = QueryCache(
+            capacity=query_cache_size, threshold=query_cache_threshold
+        )
 
     async def initialize(self) -> None:
         """Initialize ChromaDB client and collection.
@@ -59,6 +107,17 @@ class ChromaLocalRAGManager(BaseRAGManager):
                     collection_name=self.collection_name,
                 )
             )
+            if self.manifest is None:
+                # an in-memory collection gets an in-memory manifest
+                self.manifest = FileManifest(
+                    Path(self.persist_directory)
+                    / f"{self.collection_name}.manifest.sqlite3"
+                    if self.persistent
+                    else None
+                )
+            if self.collection.count() == 0:
+                # nothing loaded (yet), the manifest cannot be trusted
+                self.manifest.clear()
             await self.load_documents(self.documents_root)
         except Exception as e:  # pragma: no cover
             raise RuntimeError(f"Failed to initialize ChromaDB: {e}") from e
@@ -66,24 +125,31 @@ class ChromaLocalRAGManager(BaseRAGManager):
     async def reload_documents(self) -> None:
         """Reload documents into ChromaDB.
 
+        Only new or modified files are (re)loaded and
+        the chunks of modified or removed files are deleted.
+
         Raises
         ------
         RuntimeError
             If the RAGManager is not initialized or loading documents fails.
         """
         if not self.collection:
+            # initializing also loads the documents
             await self.initialize()
-        if not self.collection:
-            raise RuntimeError(
-                "RAGManager not initialized. Call initialize() first."
-            )
-        if not self.client:
-            raise RuntimeError("ChromaDB client not initialized.")
-        self.client.reset()
-        await self.initialize()
-        await self.load_documents(self.documents_root)
+            if not self.collection:  # pragma: no cover
+                raise RuntimeError(
+                    "RAGManager not initialized. Call initialize() first."
+                )
+        else:
+            await self.load_documents(self.documents_root)
         self.logger.info("Collection reloaded from disk.")
 
+    async def close(self) -> None:
+        """Close the manifest of the loaded files."""
+        if self.manifest:
+            self.manifest.close()
+            self.manifest = None
+
     async def search(
         self, query: str, n_results: int = 3
     ) -> list[dict[str, Any]]:
@@ -152,25 +218,23 @@ class ChromaLocalRAGManager(BaseRAGManager):
         """
         try:
             # Initialize ChromaDB client
-            settings = Settings(
-                is_persistent=True,
-                persist_directory=persist_directory,
-                allow_reset=True,
-                anonymized_telemetry=False,
+            client = chromadb.Client(
+                settings=client_settings(persist_directory, self.persistent)
             )
-            client = chromadb.Client(settings=settings)
-            embedding_function = ef.SentenceTransformerEmbeddingFunction(
+            embedding_function = get_embedding_function(
                 model_name="all-MiniLM-L6-v2",
+                backend=self.embedding_backend,
             )
             try:
                 collection = client.get_collection(
                     collection_name,
-                    embedding_function=embedding_function,  # type: ignore
+                    embedding_function=embedding_function,
                 )
             except Exception:
                 collection = client.create_collection(
                     name=collection_name,
-                    embedding_function=embedding_function,  # type: ignore
+                    embedding_function=embedding_function,
+                    metadata=self.hnsw_params,
                 )
 
             # Create collection if it doesn't exist
@@ -198,60 +262,165 @@ class ChromaLocalRAGManager(BaseRAGManager):
             )
 
         path = Path(documents_path)
-        files = self._get_supported_files(path)
-
-        documents: list[str] = []
-        metadatas: list[Metadata] = []
-        ids: list[str] = []
-
-        for file_path in files:
-            content = self.extract_text_from_file(file_path)
-            if content:  # pragma: no branch
-                chunks = self.split_text(
-                    content, self.chunk_size, self.chunk_overlap
-                )
-
-                for i, chunk in enumerate(chunks):
-                    doc_id = f"{file_path.stem}_{i}_{uuid_lib.uuid4().hex[:8]}"
-                    documents.append(chunk)
-                    metadatas.append(
-                        {
-                            "source": str(file_path),
-                            "file_name": file_path.name,
-                            "file_type": file_path.suffix.lower(),
-                            "chunk_id": i,
-                            "file_size": file_path.stat().st_size,
-                            "created_at": file_path.stat().st_mtime,
-                        }
-                    )
-                    ids.append(doc_id)
-
-        if documents:
-            # Batch process documents asynchronously
-            batch_size = 100  # Process in batches to avoid memory issues
-
-            for i in range(0, len(documents), batch_size):
-                batch_docs = documents[i : i + batch_size]
-                batch_metadatas = metadatas[i : i + batch_size]
-                batch_ids = ids[i : i + batch_size]
-                self.collection.add(
-                    documents=batch_docs,
-                    metadatas=batch_metadatas,
-                    ids=batch_ids,
+        stats = self._get_supported_files_with_stats(path)
+        files = list(stats)
+        to_load = self._sync_manifest(path, stats)
+
+        # files that could not be loaded are not recorded (retried later)
+        failed: list[Path] = []
+        chunks = self.iter_chunks(
+            to_load, self.chunk_size, self.chunk_overlap, stats, failed
+        )
+        # the files are chunked in order, so the ones before the source
+        # of the last added chunk are fully loaded (even with no chunks)
+        positions = {str(file_path): i for i, file_path in enumerate(to_load)}
+        recorded = 0
+        loaded = 0
+        # Consume the chunks in batches to avoid memory issues
+        while batch := list(islice(chunks, self.chunk_batch_size)):
+            documents, metadatas, ids = (
+                list(column) for column in zip(*batch, strict=True)
+            )
+            self._add_chunks(documents, metadatas, ids)
+            if self.manifest:
+                self.manifest.add_chunks(
+                    (str(metadata["source"]), doc_id)
+                    for metadata, doc_id in zip(metadatas, ids, strict=True)
                 )
-                batch = i // batch_size + 1
-                total_batches = (len(documents) + batch_size - 1) // batch_size
-                to_log = f"Processed batch {batch}/{total_batches}"
-                self.logger.info(to_log)
+                current = positions[str(metadatas[-1]["source"])]
+                self._record_files(to_load[recorded:current], stats, failed)
+                recorded = current
+            loaded += len(batch)
+            self.logger.info("Processed %d chunks", loaded)
+        self._record_files(to_load[recorded:], stats, failed)
+        if failed:
+            self.logger.warning(
+                "Could not load %d files, retrying on the next reload",
+                len(failed),
+            )
 
+        if loaded:
+            # cached results may no longer be the best matches
+            self.query_cache.clear()
             to_log = (
-                f"Loaded {len(documents)} document "
-                f"chunks from {len(files)} files"
+                f"Loaded {loaded} document chunks from {len(to_load)} files"
             )
             self.logger.info(to_log)
+        elif len(to_load) < len(files):
+            self.logger.info("All %d files are up to date", len(files))
         else:
             self.logger.warning("No documents found to load")
 
+    def _record_files(
+        self,
+        files: list[Path],
+        stats: dict[Path, os.stat_result],
+        failed: list[Path],
+    ) -> None:
+        """Record files whose chunks are all added to the collection.
+
+        Parameters
+        ----------
+        files : list[Path]
+            The processed files.
+        stats : dict[Path, os.stat_result]
+            The stat results of the files when they were collected.
+        failed : list[Path]
+            The files that could not be loaded, which are not recorded.
+        """
+        if self.manifest and files:
+            self.manifest.add_files(
+                (
+                    str(file_path),
+                    stats[file_path].st_mtime,
+                    stats[file_path].st_size,
+                )
+                for file_path in files
+                if file_path not in failed
+            )
+
+    def _sync_manifest(
+        self, path: Path, stats: dict[Path, os.stat_result]
+    ) -> list[Path]:
+        """Drop the chunks of removed or modified files.
+
+        Parameters
+        ----------
+        path : Path
+            The path the files were collected from.
+        stats : dict[Path, os.stat_result]
+            The current files in ``path`` and their stat results.
+
+        Returns
+        -------
+        list[Path]
+            The new or modified files that need to be loaded.
+        """
+        if not self.collection or not self.manifest:
+            return list(stats)
+        current = {str(file_path) for file_path in stats}
+        stale = [
+            source
+            for source in self.manifest.sources()
+            if source not in current
+            and path.is_dir()
+            and Path(source).is_relative_to(path)
+        ]
+        to_load: list[Path] = []
+        for file_path, stat in stats.items():
+            source = str(file_path)
+            if self.manifest.is_unchanged(source, stat.st_mtime, stat.st_size):
+                continue
+            stale.append(source)
+            to_load.append(file_path)
+        stale_ids = self.manifest.chunk_ids(stale)
+        if stale_ids:
+            self.collection.delete(ids=stale_ids)
+            self.query_cache.clear()
+            self.logger.info("Deleted %d stale chunks", len(stale_ids))
+        self.manifest.remove(stale)
+        return to_load
+
+    def _add_chunks(
+        self,
+        documents: list[str],
+        metadatas: list[Metadata],
+        ids: list[str],
+    ) -> None:
+        """Embed and add a batch of chunks to the collection.
+
+        Parameters
+        ----------
+        documents : list[str]
+            The chunks to add.
+        metadatas : list[Metadata]
+            The metadata of each chunk.
+        ids : list[str]
+            The id of each chunk.
+
+        Raises
+        ------
+        RuntimeError
+            If the RAGManager is not initialized.
+        """
+        if not self.collection:
+            raise RuntimeError(
+                "RAGManager not initialized. Call initialize() first."
+            )
+        embeddings: list[Any] | None = None
+        if self.embedding_function:
+            embeddings = self.embed_texts(
+                self.embedding_function,
+                documents,
+                self.embedding_batch_size,
+            )
+        self.collection.add(
+            documents=documents,
+            embeddings=embeddings,
+            metadatas=metadatas,
+            ids=ids,
+        )
+
     def _search(self, query: str, n_results: int = 3) -> list[dict[str, Any]]:
         """Search using ChromaDB vector search.
 
@@ -277,11 +446,24 @@ class ChromaLocalRAGManager(BaseRAGManager):
                 "RAGManager not initialized. Call initialize() first."
             )
 
-        results = self.collection.query(
-            query_texts=[query],
-            n_results=n_results,
-            include=["documents", "metadatas", "distances"],
-        )
+        if self.embedding_function:
+            # embed once, for both the cache lookup and the query
+            query_embedding = self.embedding_function([query])[0]
+            cached = self.query_cache.lookup(query_embedding, n_results)
+            if cached is not None:
+                return cached
+            results = self.collection.query(
+                query_embeddings=[query_embedding],
+                n_results=n_results,
+                include=["documents", "metadatas", "distances"],
+            )
+        else:
+            query_embedding = None
+            results = self.collection.query(
+                query_texts=[query],
+                n_results=n_results,
+                include=["documents", "metadatas", "distances"],
+            )
 
         # Format results
         formatted_results: list[dict[str, Any]] = []
@@ -308,4 +490,8 @@ class ChromaLocalRAGManager(BaseRAGManager):
                     }
                 )
 
+        if query_embedding is not None:
+            self.query_cache.store(
+                query_embedding, n_results, formatted_results
+            )
         return formatted_results
@@ -3,9 +3,9 @@
 
 """ChromaDB RAG Manager for handling document storage and retrieval."""
 
-import uuid as uuid_lib
+import asyncio
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 
 import chromadb.utils.embedding_functions as ef
 from chromadb.api.async_client import AsyncClient
@@ -15,13 +15,16 @@ from chromadb.api.models.AsyncCollection import (  # pyright: ignore
 from chromadb.api.types import Metadata
 from chromadb.config import Settings
 
-from ._base import BaseRAGManager
+from ._base import HNSW_INGEST_PARAMS, BaseRAGManager
+from ._cache import QueryCache
+from ._embeddings import EmbeddingBackend, get_embedding_function
 
 
 # pylint: disable=too-many-instance-attributes,too-many-locals,duplicate-code
 class ChromaRemoteRAGManager(BaseRAGManager):  # pragma: no cover
     """ChromaDB remote RAG Manager implementation."""
 
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     def __init__(
         self,
         host: str = "localhost",
@@ -30,8 +33,15 @@ class ChromaRemoteRAGManager(BaseRAGManager):  # pragma: no cover
         model_name: str = "all-MiniLM-L6-v2",
         chunk_size: int = 1000,
         chunk_overlap: int = 200,
+        chunk_batch_size: int = 250,
+        embedding_batch_size: int = 256,
         use_ssl: bool = False,
         documents_root: str = "documents",
+        query_cache_size: int = 256,
+        query_cache_threshold: float = 0.05,
+        embedding_backend: EmbeddingBackend = "sentence_transformers",
+        hnsw_params: Optional[dict[str, Any]] = None,
+        max_concurrent_batches: int = 8,
     ):
         super().__init__()
         self.host = host
@@ -41,10 +51,18 @@ class ChromaRemoteRAGManager(BaseRAGManager):  # pragma: no cover
         self.model_name = model_name
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.chunk_batch_size = chunk_batch_size
+        self.embedding_batch_size = embedding_batch_size
+        self.embedding_backend: EmbeddingBackend = embedding_backend
+        self.hnsw_params = {**HNSW_INGEST_PARAMS, **(hnsw_params or {})}
+        self.max_concurrent_batches = max_concurrent_batches
         self.use_ssl = use_ssl
         self.collection: Optional[AsyncCollection] = None
         self.embedding_function: Optional[ef.EmbeddingFunction[Any]] = None
         self.client: Optional[AsyncClient] = None
+        self.query_cache = QueryCache(
+            capacity=query_cache_size, threshold=query_cache_threshold
+        )
 
     async def initialize(self) -> None:
         """Initialize ChromaDB async client and collection.
@@ -58,8 +76,8 @@ class ChromaRemoteRAGManager(BaseRAGManager):  # pragma: no cover
         # pylint: disable=too-many-try-statements,broad-exception-caught
         try:
             # Initialize embedding function
-            embedding_function = ef.SentenceTransformerEmbeddingFunction(
-                self.model_name
+            embedding_function = get_embedding_function(
+                self.model_name, backend=self.embedding_backend
             )
             self.embedding_function = embedding_function
             protocol = "https" if self.use_ssl else "http"
@@ -77,7 +95,7 @@ class ChromaRemoteRAGManager(BaseRAGManager):  # pragma: no cover
             try:
                 self.collection = await self.client.get_collection(
                     name=self.collection_name,
-                    embedding_function=embedding_function,  # type: ignore
+                    embedding_function=embedding_function,
                 )
                 self.logger.info(
                     "Using existing collection: %s", self.collection_name
@@ -86,8 +104,8 @@ class ChromaRemoteRAGManager(BaseRAGManager):  # pragma: no cover
                 # Collection doesn't exist, create it
                 self.collection = await self.client.create_collection(
                     name=self.collection_name,
-                    embedding_function=embedding_function,  # type: ignore
-                    metadata={"hnsw:space": "cosine"},
+                    embedding_function=embedding_function,
+                    metadata=self.hnsw_params,
                 )
                 self.logger.info(
                     "Created new collection: %s",
@@ -123,59 +141,137 @@ class ChromaRemoteRAGManager(BaseRAGManager):  # pragma: no cover
             )
 
         path = Path(documents_path)
-        files = self._get_supported_files(path)
+        stats = self._get_supported_files_with_stats(path)
+        files = list(stats)
+
+        loaded = await self._add_batches(
+            self.a_iter_chunks(
+                files, self.chunk_size, self.chunk_overlap, stats
+            )
+        )
+
+        if loaded:
+            # cached results may no longer be the best matches
+            self.query_cache.clear()
+            to_log = f"Loaded {loaded} document chunks from {len(files)} files"
+            self.logger.info(to_log)
+        else:
+            self.logger.warning("No documents found to load")
+
+    async def _add_batches(
+        self, chunks: AsyncIterator[tuple[str, dict[str, Any], str]]
+    ) -> int:
+        """Add chunks to the collection in concurrent batches.
+
+        Up to ``max_concurrent_batches`` batches are in flight, to overlap
+        the round trips to the server with chunking and embedding.
+        If adding a batch fails, no more batches are submitted
+        and the ones in flight are cancelled.
+
+        Parameters
+        ----------
+        chunks : AsyncIterator[tuple[str, dict[str, Any], str]]
+            The chunks, their metadata and their ids.
 
+        Returns
+        -------
+        int
+            The number of added chunks.
+        """
         documents: list[str] = []
         metadatas: list[Metadata] = []
         ids: list[str] = []
+        loaded = 0
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrent_batches))
+        tasks: list[asyncio.Task[None]] = []
+        failures: list[Exception] = []
+
+        async def _add_batch(
+            documents: list[str], metadatas: list[Metadata], ids: list[str]
+        ) -> None:
+            nonlocal loaded
+            try:
+                await self._add_chunks(documents, metadatas, ids)
+            except Exception as e:
+                failures.append(e)
+                raise
+            finally:
+                semaphore.release()
+            loaded += len(documents)
+            self.logger.info("Processed %d chunks", loaded)
+
+        async def _submit_batch(
+            documents: list[str], metadatas: list[Metadata], ids: list[str]
+        ) -> None:
+            await semaphore.acquire()
+            if failures:
+                # stop early, the batches in flight are cancelled below
+                semaphore.release()
+                raise failures[0]
+            tasks.append(
+                asyncio.create_task(_add_batch(documents, metadatas, ids))
+            )
 
-        for file_path in files:
-            content = await self.a_extract_text_from_file(file_path)
-            if content:
-                chunks = self.split_text(
-                    content, self.chunk_size, self.chunk_overlap
-                )
+        # pylint: disable=too-many-try-statements
+        try:
+            # Consume the chunks in batches to avoid memory issues
+            async for chunk, metadata, doc_id in chunks:
+                documents.append(chunk)
+                metadatas.append(metadata)
+                ids.append(doc_id)
+                if len(documents) >= self.chunk_batch_size:
+                    await _submit_batch(documents, metadatas, ids)
+                    documents, metadatas, ids = [], [], []
+            if documents:
+                await _submit_batch(documents, metadatas, ids)
+            await asyncio.gather(*tasks)
+        finally:
+            # on failure, do not leave batches being added in the background
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return loaded
+
+    async def _add_chunks(
+        self,
+        documents: list[str],
+        metadatas: list[Metadata],
+        ids: list[str],
+    ) -> None:
+        """Embed and add a batch of chunks to the collection.
 
-                for i, chunk in enumerate(chunks):
-                    doc_id = f"{file_path.stem}_{i}_{uuid_lib.uuid4().hex[:8]}"
-                    documents.append(chunk)
-                    metadatas.append(
-                        {
-                            "source": str(file_path),
-                            "file_name": file_path.name,
-                            "file_type": file_path.suffix.lower(),
-                            "chunk_id": i,
-                            "file_size": file_path.stat().st_size,
-                            "created_at": file_path.stat().st_mtime,
-                        }
-                    )
-                    ids.append(doc_id)
-
-        if documents:
-            # Batch process documents asynchronously
-            batch_size = 100  # Process in batches to avoid memory issues
-
-            for i in range(0, len(documents), batch_size):
-                batch_docs = documents[i : i + batch_size]
-                batch_metadatas = metadatas[i : i + batch_size]
-                batch_ids = ids[i : i + batch_size]
-                await self.collection.add(
-                    documents=batch_docs,
-                    metadatas=batch_metadatas,
-                    ids=batch_ids,
-                )
-                batch = i // batch_size + 1
-                total_batches = (len(documents) + batch_size - 1) // batch_size
-                to_log = f"Processed batch {batch}/{total_batches}"
-                self.logger.info(to_log)
-
-            to_log = (
-                f"Loaded {len(documents)} document "
-                f"chunks from {len(files)} files"
+        Parameters
+        ----------
+        documents : list[str]
+            The chunks to add.
+        metadatas : list[Metadata]
+            The metadata of each chunk.
+        ids : list[str]
+            The id of each chunk.
+
+        Raises
+        ------
+        RuntimeError
+            If the RAGManager is not initialized.
+        """
+        if not self.collection:
+            raise RuntimeError(
+                "RAGManager not initialized. Call initialize() first."
             )
-            self.logger.info(to_log)
-        else:
-            self.logger.warning("No documents found to load")
+        embeddings: list[Any] | None = None
+        if self.embedding_function:
+            embeddings = await asyncio.to_thread(
+                self.embed_texts,
+                self.embedding_function,
+                documents,
+                self.embedding_batch_size,
+            )
+        await self.collection.add(
+            documents=documents,
+            embeddings=embeddings,
+            metadatas=metadatas,
+            ids=ids,
+        )
 
     async def reload_documents(self) -> None:
         """Reload documents into ChromaDB asynchronously.
@@ -194,6 +290,7 @@ class ChromaRemoteRAGManager(BaseRAGManager):  # pragma: no cover
             )
 
         await self.delete_collection()
+        self.query_cache.clear()
         await self.load_documents(self.documents_root)
 
     async def search(
@@ -224,11 +321,27 @@ class ChromaRemoteRAGManager(BaseRAGManager):  # pragma: no cover
                 "RAGManager not initialized. Call initialize() first."
             )
 
-        results = await self.collection.query(
-            query_texts=[query],
-            n_results=n_results,
-            include=["documents", "metadatas", "distances"],
-        )
+        query_embedding = None
+        if self.embedding_function:
+            # embed once, for both the cache lookup and the query
+            embeddings = await asyncio.to_thread(
+                self.embedding_function, [query]
+            )
+            query_embedding = embeddings[0]
+            cached = self.query_cache.lookup(query_embedding, n_results)
+            if cached is not None:
+                return cached
+            results = await self.collection.query(
+                query_embeddings=[query_embedding],
+                n_results=n_results,
+                include=["documents", "metadatas", "distances"],
+            )
+        else:
+            results = await self.collection.query(
+                query_texts=[query],
+                n_results=n_results,
+                include=["documents", "metadatas", "distances"],
+            )
 
         # Format results
         formatted_results: list[dict[str, Any]] = []
@@ -255,6 +368,10 @@ class ChromaRemoteRAGManager(BaseRAGManager):  # pragma: no cover
                     }
                 )
 
+        if query_embedding is not None:
+            self.query_cache.store(
+                query_embedding, n_results, formatted_results
+            )
         return formatted_results
 
     async def delete_collection(self) -> None:
@@ -0,0 +1,218 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2025 Thingenious.
+
+"""Embedding functions for the RAG managers."""
+
+import logging
+import os
+import threading
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import Any, Callable, Literal, Optional
+
+import chromadb.utils.embedding_functions as ef
+from chromadb.api.types import EmbeddingFunction
+from chromadb.utils.embedding_functions.onnx_mini_lm_l6_v2 import (
+    ONNXMiniLM_L6_V2,
+)
+
+EmbeddingBackend = Literal["sentence_transformers", "onnx"]
+
+_LOG = logging.getLogger(__name__)
+# one conversion (and session creation) at a time in this process
+_MODEL_LOCK = threading.Lock()
+
+
+class _ONNXEmbeddingFunction(ONNXMiniLM_L6_V2):
+    """``all-MiniLM-L6-v2`` on ONNX Runtime with reduced precision weights.
+
+    On CPU, the exported model is dynamically quantized (``qint8``
+    weights); on CUDA, the weights are converted to FP16. The converted
+    copy is created on first use and kept next to the original one.
+    If the conversion tooling is not available, the FP32 model is used.
+
+    The session is created once, even if the first embeddings are
+    computed from several threads at the same time.
+
+    This relies on (non public) attributes of chroma's embedding
+    function, keep the chromadb requirement bounded accordingly.
+    """
+
+    QUANTIZED_MODEL_NAME = "model_qint8.onnx"
+    FP16_MODEL_NAME = "model_fp16.onnx"
+
+    def __init__(self, preferred_providers: Optional[list[str]] = None):
+        super().__init__(
+            preferred_providers=preferred_providers or _default_providers()
+        )
+        self._session: Any = None
+
+    @property
+    def uses_cuda(self) -> bool:
+        """Check if the model runs on a CUDA device.
+
+        Returns
+        -------
+        bool
+            True if the CUDA execution provider is preferred.
+        """
+        providers = self._preferred_providers or []
+        return bool(providers) and providers[0] == "CUDAExecutionProvider"
+
+    @cached_property
+    def model(self) -> Any:
+        """Get the ONNX Runtime inference session.
+
+        Returns
+        -------
+        Any
+            The inference session.
+        """
+        with _MODEL_LOCK:
+            if self._session is None:
+                self._session = self._create_session()
+            return self._session
+
+    def _create_session(self) -> Any:
+        """Convert the model if needed and create its inference session.
+
+        Returns
+        -------
+        Any
+            The inference session.
+        """
+        model_dir = Path(self.DOWNLOAD_PATH) / self.EXTRACTED_FOLDER_NAME
+        if self.uses_cuda:
+            model_path = _convert(
+                model_dir / "model.onnx",
+                model_dir / self.FP16_MODEL_NAME,
+                _to_fp16,
+            )
+        else:
+            model_path = _convert(
+                model_dir / "model.onnx",
+                model_dir / self.QUANTIZED_MODEL_NAME,
+                _quantize,
+            )
+        options = self.ort.SessionOptions()
+        options.log_severity_level = 3
+        options.enable_mem_pattern = True
+        options.graph_optimization_level = (
+            self.ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        )
+        return self.ort.InferenceSession(
+            str(model_path),
+            providers=self._preferred_providers,
+            sess_options=options,
+        )
+
+
+def _default_providers() -> list[str]:
+    """Get the execution providers to use, preferring CUDA if available.
+
+    Returns
+    -------
+    list[str]
+        The ONNX Runtime execution providers.
+    """
+    # pylint: disable=import-outside-toplevel
+    import onnxruntime  # type: ignore[import-untyped]
+
+    if "CUDAExecutionProvider" in onnxruntime.get_available_providers():
+        return ["CUDAExecutionProvider", "CPUExecutionProvider"]
+    return ["CPUExecutionProvider"]
+
+
+def _quantize(model_path: Path, output_path: Path) -> None:
+    """Dynamically quantize an ONNX model to int8 weights."""
+    # pylint: disable=import-outside-toplevel
+    from onnxruntime.quantization import (  # type: ignore[import-untyped]
+        QuantType,
+        quantize_dynamic,
+    )
+
+    quantize_dynamic(model_path, output_path, weight_type=QuantType.QInt8)
+
+
+def _to_fp16(model_path: Path, output_path: Path) -> None:
+    """Convert the weights of an ONNX model to FP16."""
+    # pylint: disable=import-outside-toplevel
+    import onnx
+    from onnxruntime.transformers.float16 import (  # type: ignore
+        convert_float_to_float16,
+    )
+
+    model = convert_float_to_float16(
+        onnx.load(str(model_path)), keep_io_types=True
+    )
+    onnx.save(model, str(output_path))
+
+
+def _convert(
+    model_path: Path,
+    output_path: Path,
+    converter: Callable[[Path, Path], None],
+) -> Path:
+    """Convert an ONNX model, falling back to the original one.
+
+    The model is converted to a temporary file which is then renamed,
+    so an interrupted conversion never leaves a truncated model behind
+    and concurrent conversions (e.g. by other workers) do not clash.
+
+    Parameters
+    ----------
+    model_path : Path
+        The FP32 model.
+    output_path : Path
+        Where to store the converted model.
+    converter : Callable[[Path, Path], None]
+        The conversion to apply.
+
+    Returns
+    -------
+    Path
+        The converted model, or the original one if the conversion failed.
+    """
+    if output_path.exists():
+        return output_path
+    temp_path = output_path.with_suffix(f".tmp-{os.getpid()}")
+    try:
+        converter(model_path, temp_path)
+        os.replace(temp_path, output_path)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        _LOG.warning("Could not convert %s, using FP32: %s", model_path, e)
+        temp_path.unlink(missing_ok=True)
+        return model_path
+    return output_path
+
+
+@lru_cache(maxsize=None)
+def get_embedding_function(
+    model_name: str = "all-MiniLM-L6-v2",
+    backend: EmbeddingBackend = "sentence_transformers",
+) -> EmbeddingFunction[Any]:
+    """Get the embedding function to use with chroma.
+
+    The embedding functions (and their loaded models) are cached,
+    so managers using the same model share a single instance.
+
+    Parameters
+    ----------
+    model_name : str, optional
+        The sentence-transformers model, by default "all-MiniLM-L6-v2".
+    backend : EmbeddingBackend, optional
+        The inference backend, by default "sentence_transformers".
+        The "onnx" backend is only available for "all-MiniLM-L6-v2".
+
+    Returns
+    -------
+    EmbeddingFunction[Any]
+        The embedding function.
+    """
+    if backend == "onnx":
+        if model_name.split("/")[-1] == ONNXMiniLM_L6_V2.MODEL_NAME:
+            return _ONNXEmbeddingFunction()
+        _LOG.warning(
+            "No ONNX export for %s, using sentence-transformers", model_name
+        )
+    return ef.SentenceTransformerEmbeddingFunction(model_name=model_name)
@@ -0,0 +1,169 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2025 Thingenious.
+
+"""Manifest of the files (and their chunks) loaded into a collection."""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterable
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    source TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS chunks (
+    source TEXT NOT NULL,
+    chunk_id TEXT PRIMARY KEY
+);
+CREATE INDEX IF NOT EXISTS idx_chunks_source ON chunks (source);
+"""
+_UNCHANGED = """
+SELECT 1 FROM files WHERE source = ? AND mtime = ? AND size = ?
+"""
+_SOURCES = """
+SELECT source FROM files UNION SELECT source FROM chunks
+"""
+_INSERT_CHUNK = """
+INSERT OR REPLACE INTO chunks (source, chunk_id) VALUES (?, ?)
+"""
+_INSERT_FILE = """
+INSERT OR REPLACE INTO files (source, mtime, size) VALUES (?, ?, ?)
+"""
+
+
+class FileManifest:
+    """SQLite sidecar mapping loaded files to their chunk ids.
+
+    A file whose modification time and size did not change since it
+    was loaded does not need to be extracted and embedded again.
+    Chunk ids are recorded as soon as they are added to the collection,
+    while a file is only recorded once all of its chunks (if any) are,
+    so a partially loaded file is loaded again.
+
+    Parameters
+    ----------
+    db_path : Path | None, optional
+        The path of the SQLite database file,
+        by default None (the manifest is kept in memory).
+    """
+
+    def __init__(self, db_path: Path | None = None) -> None:
+        if db_path is not None:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            ":memory:" if db_path is None else str(db_path),
+            check_same_thread=False,
+        )
+        with self._lock, self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def is_unchanged(self, source: str, mtime: float, size: int) -> bool:
+        """Check if a file is already loaded with the same mtime and size.
+
+        Parameters
+        ----------
+        source : str
+            The path of the file.
+        mtime : float
+            The current modification time of the file.
+        size : int
+            The current size of the file.
+
+        Returns
+        -------
+        bool
+            True if the file is fully loaded and did not change.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                _UNCHANGED, (source, mtime, size)
+            ).fetchone()
+        return row is not None
+
+    def sources(self) -> set[str]:
+        """Get the paths of all the (even partially) loaded files.
+
+        Returns
+        -------
+        set[str]
+            The paths of the loaded files.
+        """
+        with self._lock:
+            rows = self._connection.execute(_SOURCES).fetchall()
+        return {row[0] for row in rows}
+
+    def chunk_ids(self, sources: Iterable[str]) -> list[str]:
+        """Get the chunk ids of files.
+
+        Parameters
+        ----------
+        sources : Iterable[str]
+            The paths of the files.
+
+        Returns
+        -------
+        list[str]
+            The ids of the chunks of the files.
+        """
+        ids: list[str] = []
+        with self._lock:
+            for source in sources:
+                rows = self._connection.execute(
+                    "SELECT chunk_id FROM chunks WHERE source = ?", (source,)
+                ).fetchall()
+                ids.extend(row[0] for row in rows)
+        return ids
+
+    def add_chunks(self, rows: Iterable[tuple[str, str]]) -> None:
+        """Record chunks added to the collection.
+
+        Parameters
+        ----------
+        rows : Iterable[tuple[str, str]]
+            The (source, chunk_id) of each chunk.
+        """
+        with self._lock, self._connection:
+            self._connection.executemany(_INSERT_CHUNK, rows)
+
+    def add_files(self, rows: Iterable[tuple[str, float, int]]) -> None:
+        """Record fully loaded files.
+
+        Parameters
+        ----------
+        rows : Iterable[tuple[str, float, int]]
+            The (source, mtime, size) of each file.
+        """
+        with self._lock, self._connection:
+            self._connection.executemany(_INSERT_FILE, rows)
+
+    def remove(self, sources: Iterable[str]) -> None:
+        """Forget files and their chunks.
+
+        Parameters
+        ----------
+        sources : Iterable[str]
+            The paths of the files.
+        """
+        params = [(source,) for source in sources]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM chunks WHERE source = ?", params
+            )
+            self._connection.executemany(
+                "DELETE FROM files WHERE source = ?", params
+            )
+
+    def clear(self) -> None:
+        """Forget all the loaded files."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM chunks")
+            self._connection.execute("DELETE FROM files")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
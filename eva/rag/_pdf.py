@@ -9,11 +9,15 @@
 # pylint: disable=too-many-try-statements,too-few-public-methods
 import logging
 from pathlib import Path
+from typing import Any
 
 import pymupdf  # type: ignore[import-untyped]
 
 logger = logging.getLogger(__name__)
 
+# the fewest line segments on a page that could be the borders of a table
+MIN_TABLE_LINES = 4
+
 
 class PDFLoader:
     """Class to load and process PDF files using PyMuPDF."""
@@ -105,9 +109,11 @@ def _extract_page_content(
         text_content = _extract_page_text(page, page_num)
         page_content.extend(text_content)
 
-        # Extract tables
-        table_content = _extract_page_tables(page, page_num)
-        page_content.extend(table_content)
+        # Extract tables, only if the page has the lines of a grid
+        drawings = page.get_drawings()  # pyright: ignore
+        if _page_might_have_table(drawings):
+            table_content = _extract_page_tables(page, page_num, drawings)
+            page_content.extend(table_content)
 
     except Exception as e:
         logger.warning("Error processing page %d: %s", page_num + 1, e)
@@ -130,6 +136,7 @@ def _extract_page_text(
     text_content = []
 
     try:
+        # plain text extraction, the images of the page are not decoded
         text = page.get_text()  # pyright: ignore
         if text and text.strip():  # pragma: no branch
             text_content.extend(
@@ -147,15 +154,35 @@ def _extract_page_text(
     return text_content
 
 
+def _page_might_have_table(drawings: list[dict[str, Any]]) -> bool:
+    """Check if the vector graphics of a page could form a table.
+
+    Table detection looks for cell borders, so a page without at least
+    a few line segments (or rectangle edges) cannot have a table.
+    """
+    segments = 0
+    for drawing in drawings:
+        for item in drawing.get("items", []):
+            if item[0] == "l":
+                segments += 1
+            elif item[0] in ("re", "qu"):
+                segments += 4
+            if segments >= MIN_TABLE_LINES:
+                return True
+    return False
+
+
 def _extract_page_tables(
     page: pymupdf.Page,
     page_num: int,
+    drawings: list[dict[str, Any]] | None = None,
 ) -> list[str]:
     """Extract table content from a PDF page."""
     table_content = []
 
     try:
-        tables = page.find_tables()  # pyright: ignore
+        # reuse the already extracted vector graphics if any
+        tables = page.find_tables(paths=drawings)  # pyright: ignore
         if tables.tables:
             for table_num, table in enumerate(tables.tables):  # pyright: ignore
                 table_data = _extract_single_table(
@@ -182,12 +209,10 @@ def _extract_single_table(
         extracted_data = table.extract()
         if extracted_data:  # pragma: no branch
             for row in extracted_data:
-                if _is_valid_table_row(row):  # pyright: ignore
-                    row_text = " | ".join(
-                        str(cell or "").strip()  # pyright: ignore
-                        for cell in row
-                    )
-                    table_data.append(row_text)
+                # strip each cell once, for both the check and the join
+                cells = [str(cell or "").strip() for cell in row or []]
+                if any(cells):
+                    table_data.append(" | ".join(cells))
     except Exception as e:
         logger.warning(
             "Error extracting table %d from page %d: %s",
@@ -198,8 +223,3 @@ def _extract_single_table(
         table_data.append("Error: Could not extract table data")
 
     return table_data
-
-
-def _is_valid_table_row(row: pymupdf.table.TableRow) -> bool:
-    """Check if a table row contains valid data (not empty)."""
-    return row and any(c and str(c).strip() for c in row)  # pyright: ignore
@@ -7,13 +7,68 @@
 # pylint: disable=too-many-try-statements,import-outside-toplevel
 import json
 import logging
+import mmap
+import os
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
+
+import orjson
 
 from ._pdf import PDFLoader
 
 logger = logging.getLogger(__name__)
 
+MMAP_MIN_SIZE = 1 << 20
+
+_DOCX_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_DOCX_BODY = f"{{{_DOCX_NS}}}body"
+_DOCX_P = f"{{{_DOCX_NS}}}p"
+_DOCX_RUN = f"{{{_DOCX_NS}}}r"
+_DOCX_HYPERLINK = f"{{{_DOCX_NS}}}hyperlink"
+_DOCX_TEXT = f"{{{_DOCX_NS}}}t"
+_DOCX_BREAK = f"{{{_DOCX_NS}}}br"
+_DOCX_TYPE = f"{{{_DOCX_NS}}}type"
+_DOCX_RUN_CHARS = {
+    f"{{{_DOCX_NS}}}tab": "\t",
+    f"{{{_DOCX_NS}}}ptab": "\t",
+    f"{{{_DOCX_NS}}}cr": "\n",
+    f"{{{_DOCX_NS}}}noBreakHyphen": "-",
+}
+_ODF_TEXT_NS = "urn:oasis:names:tc:opendocument:xmlns:text:1.0"
+_ODF_TABLE_NS = "urn:oasis:names:tc:opendocument:xmlns:table:1.0"
+_ODF_P = f"{{{_ODF_TEXT_NS}}}p"
+_ODF_TABLE = f"{{{_ODF_TABLE_NS}}}table"
+_ODF_TABLE_ROW = f"{{{_ODF_TABLE_NS}}}table-row"
+_ODF_TABLE_CELL = f"{{{_ODF_TABLE_NS}}}table-cell"
+
+
+def _read_text(file_path: Path) -> str:
+    """Read a UTF-8 text file, memory-mapping large ones.
+
+    Large files are decoded straight from the mapped pages,
+    without first copying them into a bytes buffer.
+    Newlines are translated like ``Path.read_text`` does.
+
+    Parameters
+    ----------
+    file_path : Path
+        The path to the text file to read.
+
+    Returns
+    -------
+    str
+        The content of the file.
+    """
+    with open(file_path, "rb") as file:
+        if os.fstat(file.fileno()).st_size < MMAP_MIN_SIZE:
+            text = file.read().decode("utf-8")
+        else:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                text = str(mapped, "utf-8")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
 
 def load_txt(file_path: Path) -> str:
     """Load a text file and return its content as a string.
@@ -28,7 +83,7 @@ def load_txt(file_path: Path) -> str:
     str
         The content of the text file as a string.
     """
-    return file_path.read_text(encoding="utf-8")
+    return _read_text(file_path)
 
 
 def load_md(file_path: Path) -> str:
@@ -44,7 +99,7 @@ def load_md(file_path: Path) -> str:
     str
         The content of the Markdown file as a string.
     """
-    return file_path.read_text(encoding="utf-8")
+    return _read_text(file_path)
 
 
 def load_json(file_path: Path) -> str:
@@ -61,7 +116,12 @@ def load_json(file_path: Path) -> str:
         The content of the JSON file as a pretty-formatted string.
     """
     # Return as pretty-formatted string for chunking/search
-    data = json.loads(file_path.read_text(encoding="utf-8"))
+    raw = file_path.read_bytes()
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # e.g. NaN/Infinity or integers larger than 64 bits
+        data = json.loads(raw.decode("utf-8"))
     content_parts = [f"JSON File: {file_path.name}"]
     content_parts.append(_json_to_text(data))
     return "\n".join(content_parts)
@@ -69,34 +129,50 @@ def load_json(file_path: Path) -> str:
 
 def _json_to_text(obj: Any, prefix: str = "") -> str:
     """Convert JSON object to readable text."""
-    parts: list[str] = []
+    if not isinstance(obj, (dict, list)):
+        return str(obj)
+    items = _json_items(obj)  # pyright: ignore
+    values = obj.values() if isinstance(obj, dict) else obj  # pyright: ignore
+    if not any(isinstance(value, (dict, list)) for value in values):
+        # flat (the common case), no need for the stack
+        return "\n".join(f"{prefix}{label}: {value}" for label, value in items)
+    lines: list[str] = []
+    # iterators of (label, value) pairs and their indentation
+    stack = [(items, prefix)]
+    while stack:
+        items, indent = stack[-1]
+        for label, value in items:
+            if not isinstance(value, (dict, list)):
+                lines.append(f"{indent}{label}: {value}")
+                continue
+            lines.append(f"{indent}{label}:")
+            if not value:
+                lines.append("")
+                continue
+            stack.append((_json_items(value), indent + "  "))  # pyright: ignore
+            break
+        else:
+            stack.pop()
+    return "\n".join(lines)
+
+
+def _json_items(obj: dict[Any, Any] | list[Any]) -> Iterator[tuple[Any, Any]]:
+    """Get the labels and values of a JSON object or array."""
     if isinstance(obj, dict):
-        for key, value in obj.items():  # pyright: ignore
-            if isinstance(value, (dict, list)):
-                parts.append(f"{prefix}{key}:")
-                parts.append(_json_to_text(value, prefix + "  "))
-            else:
-                parts.append(f"{prefix}{key}: {value}")
-        return "\n".join(parts)
-    if isinstance(obj, list):
-        parts = []
-        for i, item in enumerate(obj):  # pyright: ignore
-            if isinstance(item, (dict, list)):  # pragma: no cover
-                parts.append(f"{prefix}Item {i + 1}:")
-                parts.append(_json_to_text(item, prefix + "  "))
-            else:
-                parts.append(f"{prefix}Item {i + 1}: {item}")
-        return "\n".join(parts)
-    return str(obj)  # pragma: no cover
-
-
-def load_csv(file_path: Path) -> str:
+        return iter(obj.items())
+    return ((f"Item {i + 1}", item) for i, item in enumerate(obj))
+
+
+def load_csv(file_path: Path, normalize: bool = False) -> str:
     """Load a CSV file and return its content as a string.
 
     Parameters
     ----------
     file_path : Path
         The path to the CSV file to be loaded.
+    normalize : bool, optional
+        Whether to parse and re-serialize the CSV with pandas,
+        by default False (the file's text is returned as is).
 
     Returns
     -------
@@ -106,19 +182,27 @@ def load_csv(file_path: Path) -> str:
     Raises
     ------
     ImportError
-        If the pandas library is not installed.
+        If normalizing and the pandas library is not installed.
     """
+    if not normalize:
+        return _read_text(file_path)
     try:
         import pandas as pd
     except ImportError as e:
-        raise ImportError("pandas is required for CSV loading") from e
-    df = pd.read_csv(file_path)  # pyright: ignore
+        raise ImportError("pandas is required for CSV normalization") from e
+    # the values are only echoed back, no need for type inference
+    df = pd.read_csv(  # pyright: ignore
+        file_path, dtype=str, keep_default_na=False
+    )
     return df.to_csv(index=False)
 
 
 def load_docx(file_path: Path) -> str:
     """Load a DOCX file and return its content as a string.
 
+    The paragraphs of ``word/document.xml`` are streamed with lxml,
+    falling back to python-docx if lxml is not available.
+
     Parameters
     ----------
     file_path : Path
@@ -132,18 +216,202 @@ def load_docx(file_path: Path) -> str:
     Raises
     ------
     ImportError
-        If the python-docx library is not installed.
+        If neither lxml nor the python-docx library is installed.
     """
     try:
-        from docx import Document
-    except ImportError as e:
-        raise ImportError("python-docx is required for DOCX loading") from e
-    doc = Document(str(file_path))
-    return "\n".join(p.text for p in doc.paragraphs if p.text)
+        from lxml import etree
+    except ImportError:
+        try:
+            from docx import Document
+        except ImportError as e:
+            raise ImportError("python-docx is required for DOCX loading") from e
+        doc = Document(str(file_path))
+        return "\n".join(p.text for p in doc.paragraphs if p.text)
+
+    paragraphs: list[str] = []
+    with (
+        zipfile.ZipFile(file_path) as archive,
+        archive.open("word/document.xml") as content,
+    ):
+        for _, elem in etree.iterparse(
+            content, events=("end",), tag=_DOCX_P, resolve_entities=False
+        ):
+            # like python-docx, only the paragraphs of the body
+            if elem.getparent().tag != _DOCX_BODY:
+                continue
+            text = _docx_paragraph_text(elem)
+            if text:
+                paragraphs.append(text)
+            _release_element(elem)
+    return "\n".join(paragraphs)
+
+
+def _release_element(elem: Any) -> None:
+    """Free a processed lxml element and its already processed siblings.
+
+    Parameters
+    ----------
+    elem : Any
+        The lxml element.
+    """
+    elem.clear()
+    while elem.getprevious() is not None:
+        del elem.getparent()[0]
+
+
+def _docx_paragraph_text(paragraph: Any) -> str:
+    """Get the text of a DOCX paragraph, the same way python-docx does.
+
+    Parameters
+    ----------
+    paragraph : Any
+        The ``w:p`` lxml element.
+
+    Returns
+    -------
+    str
+        The text of the paragraph's runs (including hyperlinks).
+    """
+    parts: list[str] = []
+    for child in paragraph:
+        if child.tag == _DOCX_RUN:
+            runs = [child]
+        elif child.tag == _DOCX_HYPERLINK:
+            runs = child.findall(_DOCX_RUN)
+        else:
+            continue
+        for run in runs:
+            for item in run:
+                if item.tag == _DOCX_TEXT:
+                    parts.append(item.text or "")
+                elif item.tag == _DOCX_BREAK:
+                    # page and column breaks have no text
+                    if item.get(_DOCX_TYPE, "textWrapping") == "textWrapping":
+                        parts.append("\n")
+                else:
+                    parts.append(_DOCX_RUN_CHARS.get(item.tag, ""))
+    return "".join(parts)
 
 
 # pylint: disable=too-complex,too-many-locals
 def load_odt(file_path: Path) -> str:
+    """Read ODT files.
+
+    The ``content.xml`` of the document is streamed with lxml,
+    falling back to odfpy if lxml is not available.
+
+    Parameters
+    ----------
+    file_path : Path
+        The path to the ODT file to read.
+
+    Returns
+    -------
+    str
+        The content of the ODT file formatted as text.
+    """
+    try:
+        from lxml import etree
+    except ImportError:
+        return _load_odt_with_odfpy(file_path)
+
+    try:
+        with (
+            zipfile.ZipFile(file_path) as archive,
+            archive.open("content.xml") as content,
+        ):
+            paragraphs, tables = _parse_odt_content(etree, content)
+    except Exception as e:
+        logger.error("Error reading ODT file %s: %s", file_path, str(e))
+        return ""
+    return "\n".join([f"ODT Document: {file_path.name}", *paragraphs, *tables])
+
+
+def _parse_odt_content(etree: Any, content: Any) -> tuple[list[str], list[str]]:
+    """Stream the paragraphs and table rows of an ODT ``content.xml``.
+
+    Processed elements are cleared as soon as possible,
+    so memory stays bounded regardless of the document size.
+
+    Parameters
+    ----------
+    etree : Any
+        The ``lxml.etree`` module.
+    content : Any
+        The file object of the ``content.xml``.
+
+    Returns
+    -------
+    tuple[list[str], list[str]]
+        The paragraphs and the tables (header and rows) of the document.
+    """
+    paragraphs: list[str] = []
+    tables: list[str] = []
+    table_depth = 0
+    paragraph_depth = 0
+    events = etree.iterparse(
+        content,
+        events=("start", "end"),
+        tag=(_ODF_P, _ODF_TABLE, _ODF_TABLE_ROW),
+        resolve_entities=False,
+    )
+    for event, elem in events:
+        if elem.tag == _ODF_TABLE:
+            if event == "start":
+                table_depth += 1
+                tables.append("\nTable:")
+                continue
+            table_depth -= 1
+        elif elem.tag == _ODF_P:
+            if event == "start":
+                paragraph_depth += 1
+                continue
+            paragraph_depth -= 1
+            if paragraph_depth:
+                # e.g. a note's body, kept for its outer paragraph
+                continue
+            paragraphs.extend(_odt_paragraph_texts(elem))
+        elif event == "start":
+            continue
+        else:
+            row_text = " | ".join(
+                _extract_text_from_element(cell)
+                for cell in elem.iterchildren(_ODF_TABLE_CELL)
+            )
+            if row_text.strip():
+                tables.append(row_text)
+        # the text of nested elements is still needed by their row
+        # or their (outer) paragraph
+        if paragraph_depth or table_depth > (elem.tag == _ODF_TABLE_ROW):
+            continue
+        _release_element(elem)
+    return paragraphs, tables
+
+
+def _odt_paragraph_texts(paragraph: Any) -> list[str]:
+    """Get the texts of an ODT paragraph and of the paragraphs it contains.
+
+    Like odfpy, the outer paragraph (including the nested text) comes
+    first and then each nested one (e.g. a note's body), in document order.
+
+    Parameters
+    ----------
+    paragraph : Any
+        The top-level ``text:p`` lxml element.
+
+    Returns
+    -------
+    list[str]
+        The non-empty texts.
+    """
+    texts = (
+        _extract_text_from_element(element)
+        for element in paragraph.iter(_ODF_P)
+    )
+    return [text for text in texts if text]
+
+
+def _load_odt_with_odfpy(file_path: Path) -> str:
     """Read ODT files using odfpy.
 
     Parameters
@@ -198,7 +466,7 @@ def load_odt(file_path: Path) -> str:
         return ""
 
 
-LOADER_MAP = {
+LOADER_MAP: dict[str, Callable[[Path], str]] = {
     ".txt": load_txt,
     ".md": load_md,
     ".json": load_json,
@@ -208,7 +476,7 @@ LOADER_MAP = {
     ".pdf": PDFLoader.load,
 }
 
-SUPPORTED_EXTENSIONS = set(LOADER_MAP.keys())
+SUPPORTED_EXTENSIONS = frozenset(LOADER_MAP)
 
 
 # pylint: disable=too-few-public-methods
@@ -236,13 +504,60 @@ class DocumentLoader:
         ValueError
             If the file type is not supported.
         """
+        # raises FileNotFoundError, no separate exists() check needed
+        file_path.stat()
         suffix = file_path.suffix.lower()
-        if not file_path.exists():
-            raise FileNotFoundError(str(file_path))
-        if suffix not in LOADER_MAP:
+        if suffix not in SUPPORTED_EXTENSIONS:
             raise ValueError(f"Unsupported file type: {suffix}")
         return LOADER_MAP[suffix](file_path)
 
+    @staticmethod
+    def load_many(
+        paths: list[Path], max_workers: int | None = None
+    ) -> list[str]:
+        """Load several files concurrently.
+
+        Parameters
+        ----------
+        paths : list[Path]
+            The paths to the files to be loaded.
+        max_workers : int | None, optional
+            The number of threads to use, by default the
+            ``EVA_LOADER_WORKERS`` environment variable,
+            or ``min(32, os.cpu_count() or 4)`` if not set.
+
+        Returns
+        -------
+        list[str]
+            The contents of the files, in the order of ``paths``.
+
+        Raises
+        ------
+        FileNotFoundError
+            If any of the files does not exist.
+        ValueError
+            If the type of any of the files is not supported.
+        """
+        if not paths:
+            return []
+        workers = max_workers or _default_loader_workers()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(DocumentLoader.load, paths))
+
+
+def _default_loader_workers() -> int:
+    """Get the default number of threads for loading files.
+
+    Returns
+    -------
+    int
+        The number of threads to use.
+    """
+    from_env = os.environ.get("EVA_LOADER_WORKERS", "")
+    if from_env.isdigit() and int(from_env) > 0:
+        return int(from_env)
+    return min(32, os.cpu_count() or 4)
+
 
 def _extract_text_from_element(element: Any) -> str:
     """Extract plain text from ODF elements.
@@ -250,27 +565,27 @@ def _extract_text_from_element(element: Any) -> str:
     Parameters
     ----------
     element : Any
-        The ODF element from which to extract text.
+        The ODF (odfpy or lxml) element from which to extract text.
 
     Returns
     -------
     str
         The extracted text content.
     """
-    text_content: list[str] = []
+    if hasattr(element, "itertext"):
+        return "".join(element.itertext()).strip()
     # Handle text nodes directly
     if hasattr(element, "data"):
         return element.data
 
-    # Recursively extract text from child elements
-    if hasattr(element, "childNodes"):  # pragma: no branch
-        for child in element.childNodes:
-            if hasattr(child, "data"):
-                text_content.append(child.data)
-            else:  # pragma: no cover
-                # Recursively get text from nested elements
-                nested_text = _extract_text_from_element(child)
-                if nested_text:
-                    text_content.append(nested_text)
-
+    # Walk the child nodes in document order, without recursion
+    text_content: list[str] = []
+    stack = list(reversed(getattr(element, "childNodes", [])))
+    while stack:
+        node = stack.pop()
+        data = getattr(node, "data", None)
+        if data is not None:
+            text_content.append(data)
+        else:
+            stack.extend(reversed(getattr(node, "childNodes", [])))
     return "".join(text_content).strip()
@@ -1,18 +1,27 @@
 # SPDX-License-Identifier: Apache-2.0.
 # Copyright (c) 2024 - 2025 Thingenious.
 
-"""Setup for pytest configuration to check Docker availability."""
+"""Pytest configuration (Docker availability, test env) and shared fixtures."""
 
 # pylint: disable=missing-function-docstring,missing-param-doc,missing-yield-doc
 # pylint: disable=unused-argument,too-few-public-methods
 import os
 import shutil
 import subprocess
-from pathlib import Path
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator
+from unittest.mock import MagicMock
 
 import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
 
+# set by the controller, so that xdist workers do not probe again
+_DOCKER_AVAILABLE_ENV = "EVA_TESTS_DOCKER_AVAILABLE"
 
+
+@lru_cache(maxsize=1)
 def is_docker_available() -> bool:
     """Check if Docker is available/running, else False.
 
@@ -21,17 +30,30 @@ def is_docker_available() -> bool:
     bool
         True if Docker is available and running, False otherwise.
     """
+    probed = os.environ.get(_DOCKER_AVAILABLE_ENV)
+    if probed is not None:
+        return probed == "1"
+    if shutil.which("docker") is None:
+        return False
     try:
         subprocess.run(  # nosemgrep # nosec
             ["docker", "info"],
             capture_output=True,
             check=True,
+            timeout=5,
         )
         return True
     except Exception:  # pylint: disable=broad-exception-caught
         return False
 
 
+_TEST_ENV = {
+    "CHAT_API_KEY": "super-secret",
+    "DATABASE_URL": "sqlite:///test.db",
+    "LOG_LEVEL": "info",
+}
+
+
 def pytest_configure(config: pytest.Config) -> None:
     """Configure pytest to skip tests requiring Docker if not available.
 
@@ -42,80 +64,91 @@ def pytest_configure(config: pytest.Config) -> None:
     """
     # Register custom marker for clarity (optional)
     config.addinivalue_line("markers", "docker: mark test as requiring Docker")
+    # the settings come from the environment only, no .env file
+    os.environ["PYDANTIC_ENV_FILE"] = ""
+    for key, value in _TEST_ENV.items():
+        os.environ.setdefault(key, value)
     worker_id = getattr(config, "workerinput", {}).get("workerid", "master")
+    if worker_id == "master" and getattr(config.option, "numprocesses", None):
+        # probe once here, the workers inherit the result
+        os.environ[_DOCKER_AVAILABLE_ENV] = (
+            "1" if is_docker_available() else "0"
+        )
 
-    project_dir = Path(__file__).resolve().parent.parent
 
-    if worker_id == "master":
-        # Single process mode
-        _setup_single_process_env(project_dir)
-    else:
-        # Multi-worker mode - each worker gets its own .env
-        _setup_worker_env(project_dir, worker_id)
+@asynccontextmanager
+async def _no_lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Skip the startup and shutdown of the managers, they are mocked."""
+    yield
 
 
-def _setup_single_process_env(project_dir: Path) -> None:
-    """Single process testing."""
-    env_file = project_dir / ".env"
-    backup_file = project_dir / ".env.pytest_backup"
+@pytest.fixture(name="base_app", scope="session")
+def base_app_fixture() -> FastAPI:
+    """Create the application once, the tests attach their own managers.
 
-    # Backup original
-    if env_file.exists():
-        shutil.copy(env_file, backup_file)
+    Returns
+    -------
+    FastAPI
+        The EVA application (an ``EvaApp``).
+    """
+    # not at the top, the settings need the test environment first
+    from eva.main import create_app  # pylint: disable=import-outside-toplevel
 
-    # Create test .env
-    _create_test_env_file(env_file)
+    app = create_app()
+    # never create the real managers, even if a client runs the lifespan
+    app.router.lifespan_context = _no_lifespan
+    return app
 
 
-def _setup_worker_env(project_dir: Path, worker_id: str) -> None:
-    """Multi-worker testing."""
-    # Each worker gets its own .env file
-    worker_env_file = project_dir / f".env.{worker_id}"
-    # original_env_file = project_dir / ".env"
+@pytest.fixture(name="client", scope="session")
+def client_fixture(base_app: FastAPI) -> TestClient:
+    """Create a test client for the shared application.
 
-    # Create worker-specific test .env
-    _create_test_env_file(worker_env_file)
+    The client is not entered as a context manager, the (no-op)
+    lifespan does not need to run.
 
-    # Update pydantic settings to use worker-specific file
-    os.environ["PYDANTIC_ENV_FILE"] = str(worker_env_file)
+    Returns
+    -------
+    TestClient
+        The test client.
+    """
+    return TestClient(base_app)
 
 
-def _create_test_env_file(env_file: Path) -> None:
-    """Create a test .env file."""
-    with open(env_file, "w", encoding="utf-8") as f:
-        f.write("CHAT_API_KEY=super-secret\n")
-        f.write("DATABASE_URL=sqlite:///test.db\n")
-        f.write("LOG_LEVEL=info\n")
+@pytest.fixture(name="mock_managers")
+def mock_managers_fixture() -> tuple[MagicMock, MagicMock, MagicMock]:
+    """Create mocked LLM, RAG and DB managers with sensible defaults.
 
+    Tests override only what they check, e.g.
+    ``llm.generate_response = raise_error``.
 
-def pytest_unconfigure(config: pytest.Config) -> None:
-    """Clean up after all tests."""
-    worker_id = getattr(config, "workerinput", {}).get("workerid", "master")
-    project_dir = Path(__file__).resolve().parent.parent
-
-    if worker_id == "master":
-        _cleanup_single_process(project_dir)
-    else:
-        _cleanup_worker(project_dir, worker_id)
-
-
-def _cleanup_single_process(project_dir: Path) -> None:
-    """Cleanup for single process."""
-    env_file = project_dir / ".env"
-    backup_file = project_dir / ".env.pytest_backup"
-
-    if backup_file.exists():
-        if env_file.exists():
-            env_file.unlink()
-        shutil.move(backup_file, env_file)
-    else:
-        # No backup means no original .env
-        if env_file.exists():
-            env_file.unlink()
-
-
-def _cleanup_worker(project_dir: Path, worker_id: str) -> None:
-    """Cleanup for worker process."""
-    worker_env_file = project_dir / f".env.{worker_id}"
-    if worker_env_file.exists():
-        worker_env_file.unlink()
+    Returns
+    -------
+    tuple[MagicMock, MagicMock, MagicMock]
+        The (llm, rag, db) manager mocks.
+    """
+    # pylint: disable=import-outside-toplevel
+    from eva.db import DatabaseManager
+    from eva.llm import LLMManager
+    from eva.rag import RAGManager
+
+    # spec'd mocks: the async methods become AsyncMocks on first access
+    # and unknown attributes are rejected
+    llm = MagicMock(spec_set=LLMManager)
+    llm.summarize_conversation.return_value = "A summary."
+
+    rag = MagicMock(spec_set=RAGManager)
+    rag.search.return_value = [
+        {"content": "France is a country in Europe.", "id": "source1"},
+    ]
+
+    db = MagicMock(spec_set=DatabaseManager)
+    db.get_admin_setting.return_value = "You are a helpful assistant."
+    db.create_conversation.return_value = "conv123"
+    db.get_conversation_messages.return_value = [
+        {"role": "user", "content": "What's the capital of France?"},
+    ]
+    db.list_conversations.return_value = ["c1", "c2"]
+    db.count_conversations.return_value = 2
+    db.get_latest_summary.return_value = None
+    return llm, rag, db
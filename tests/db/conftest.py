@@ -0,0 +1,46 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2025 Thingenious.
+
+"""Shared fixtures for the database tests."""
+# pylint: disable=missing-return-doc,missing-param-doc,missing-yield-doc
+
+from typing import AsyncGenerator, Generator
+
+import pytest
+from testcontainers.postgres import (  # type: ignore[import-untyped]
+    PostgresContainer,
+)
+
+from eva.db._postgres import PostgresDatabaseManager
+
+_TABLES = "conversations, messages, conversation_summaries, admin_settings"
+
+
+@pytest.fixture(scope="session", name="postgres_url")
+def postgres_url_fixture() -> Generator[str, None, None]:
+    """Spins up a Postgres container shared by the whole test session.
+
+    Only ``test_postgres.py`` uses it, so with ``--dist loadfile``
+    a single xdist worker starts the container.
+    """
+    postgres = PostgresContainer("postgres:17").start()
+    try:
+        # testcontainers returns a psycopg2 URL, but psycopg3 works too
+        db_url = postgres.get_connection_url()
+        yield db_url.replace("+psycopg2", "").replace("+psycopg", "")
+    finally:
+        postgres.stop()
+
+
+@pytest.fixture(name="db_manager")
+async def db_manager_fixture(
+    postgres_url: str,
+) -> AsyncGenerator[PostgresDatabaseManager, None]:
+    """Fixture to create an instance of PostgresDatabaseManager."""
+    db = PostgresDatabaseManager(postgres_url)
+    await db.init_db()
+    assert db.pool is not None
+    async with db.pool.connection() as conn:
+        await conn.execute(f"TRUNCATE {_TABLES} RESTART IDENTITY CASCADE")
+    yield db
+    await db.close()
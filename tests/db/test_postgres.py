@@ -5,12 +5,7 @@
 # pylint: disable=missing-return-doc,missing-param-doc,missing-yield-doc
 # pylint: disable=missing-function-docstring,missing-class-docstring
 
-from typing import AsyncGenerator, Generator
-
 import pytest
-from testcontainers.postgres import (  # type: ignore[import-untyped]
-    PostgresContainer,
-)
 
 from eva.db._postgres import PostgresDatabaseManager
 from tests.conftest import is_docker_available
@@ -21,27 +16,6 @@ pytestmark = pytest.mark.skipif(
 )
 
 
-@pytest.fixture(scope="module", name="postgres_url")
-def postgres_url_fixture() -> Generator[str, None, None]:
-    """Spins up a temporary Postgres container for the test module."""
-    with PostgresContainer("postgres:17") as postgres:
-        # testcontainers returns a psycopg2 URL, but psycopg3 works with it too
-        db_url = postgres.get_connection_url()
-        db_url = db_url.replace("+psycopg2", "").replace("+psycopg", "")
-        yield db_url
-
-
-@pytest.fixture(name="db_manager")
-async def db_manager_fixture(
-    postgres_url: str,
-) -> AsyncGenerator[PostgresDatabaseManager, None]:
-    """Fixture to create an instance of PostgresDatabaseManager."""
-    db = PostgresDatabaseManager(postgres_url)
-    await db.init_db()
-    yield db
-    await db.close()
-
-
 @pytest.mark.asyncio
 async def test_create_and_retrieve_conversation(
     db_manager: PostgresDatabaseManager,
@@ -5,85 +5,87 @@
 
 # pylint: disable=missing-return-doc,missing-param-doc,missing-yield-doc
 # pylint: disable=missing-function-docstring,missing-class-docstring
-from unittest.mock import AsyncMock, MagicMock, patch
+from collections import namedtuple
+from typing import Any, AsyncGenerator
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from eva.llm._anthropic import AnthropicLLMManager
-from eva.models import ChatMessage
 
+_AnthropicMessage = namedtuple("_AnthropicMessage", "content")
+_AnthropicChunk = namedtuple("_AnthropicChunk", "text")
 
-@pytest.mark.asyncio
-@patch("eva.llm._anthropic.AsyncAnthropic")
-async def test_anthropic_manager_parses_json(mock_anthropic: AsyncMock) -> None:
-    """Test that the Anthropic LLM manager correctly parses JSON responses."""
-    # Simulate Anthropic client
-    mock_resp = AsyncMock()
-    mock_resp.messages.create.return_value.content = [
-        type(
-            "Obj",
-            (),
-            {"text": '{"segments": [{"content": "Hi!", "emotion": "happy"}]}'},
-        )()
-    ]
-    mock_anthropic.return_value = mock_resp
 
-    manager = AnthropicLLMManager()
-    messages = [{"role": "user", "content": "hi"}]
-    chunks: list[ChatMessage] = []
-    async for chunk in await manager.generate_response(messages):
-        chunks.append(chunk)
-    assert chunks[0].content == "Hi!"
-    assert chunks[0].emotion == "happy"
+@pytest.fixture(name="anthropic")
+async def anthropic_fixture() -> (
+    AsyncGenerator[tuple[AnthropicLLMManager, AsyncMock], None]
+):
+    """Anthropic LLM manager with a mocked client."""
+    with patch("eva.llm._anthropic.AsyncAnthropic") as mock_anthropic:
+        mock_client = AsyncMock()
+        mock_anthropic.return_value = mock_client
+        manager = AnthropicLLMManager()
+        yield manager, mock_client
+        await manager.close()
 
 
 @pytest.mark.asyncio
-@patch("eva.llm._anthropic.AsyncAnthropic")
-async def test_anthropic_generate_response_error(
-    mock_anthropic: AsyncMock,
+@pytest.mark.parametrize(
+    ("outcome", "content", "emotion"),
+    [
+        (
+            _AnthropicMessage(
+                content=[
+                    _AnthropicChunk(
+                        text='{"segments": [{"content": "Hi!", '
+                        '"emotion": "happy"}]}'
+                    )
+                ]
+            ),
+            "Hi!",
+            "happy",
+        ),
+        (Exception("boom"), "Error generating response: boom", "concerned"),
+    ],
+    ids=["parses_json", "error"],
+)
+async def test_anthropic_generate_response(
+    anthropic: tuple[AnthropicLLMManager, AsyncMock],
+    outcome: Any,
+    content: str,
+    emotion: str,
 ) -> None:
-    """Test that Anthropic LLM manager handles errors gracefully."""
-    mock_client = AsyncMock()
-    mock_client.messages.create.side_effect = Exception("boom")
-    mock_anthropic.return_value = mock_client
-
-    manager = AnthropicLLMManager()
-    messages = [{"role": "user", "content": "test"}]
-    gen = await manager.generate_response(messages)
-    chunks = [chunk async for chunk in gen]
-    assert any("Error generating response" in c.content for c in chunks)
+    """Test generating (and parsing) responses, or handling errors."""
+    manager, mock_client = anthropic
+    mock_client.messages.create.side_effect = [outcome]
+    messages = [{"role": "user", "content": "hi"}]
+    chunks = [
+        chunk async for chunk in await manager.generate_response(messages)
+    ]
+    assert chunks[0].content == content
+    assert chunks[0].emotion == emotion
 
 
 @pytest.mark.asyncio
-@patch("eva.llm._anthropic.AsyncAnthropic")
+@pytest.mark.parametrize(
+    ("outcome", "expected"),
+    [
+        (
+            _AnthropicMessage(content=[{"text": "Anthropic summary!"}]),
+            "Anthropic summary!",
+        ),
+        (Exception("fail!"), "Conversation summary unavailable"),
+    ],
+    ids=["summary", "error"],
+)
 async def test_anthropic_summarize_conversation(
-    mock_anthropic: AsyncMock,
+    anthropic: tuple[AnthropicLLMManager, AsyncMock],
+    outcome: Any,
+    expected: str,
 ) -> None:
-    """Test that Anthropic LLM manager summarizes conversation correctly."""
-    mock_response = MagicMock()
-    mock_response.content = [{"text": "Anthropic summary!"}]
-    mock_client = AsyncMock()
-    mock_client.messages.create.return_value = mock_response
-    mock_anthropic.return_value = mock_client
-
-    manager = AnthropicLLMManager()
-    messages = [{"role": "user", "content": "Hi"}]
-    result = await manager.summarize_conversation(messages)
-    assert result == "Anthropic summary!"
-
-
-@pytest.mark.asyncio
-@patch("eva.llm._anthropic.AsyncAnthropic")
-async def test_anthropic_summarize_conversation_error(
-    mock_anthropic: AsyncMock,
-) -> None:
-    """Test that Anthropic LLM manager handles errors in summarization."""
-    mock_client = AsyncMock()
-    mock_client.messages.create.side_effect = Exception("fail!")
-    mock_anthropic.return_value = mock_client
-
-    manager = AnthropicLLMManager()
+    """Test summarizing a conversation, or handling errors."""
+    manager, mock_client = anthropic
+    mock_client.messages.create.side_effect = [outcome]
     messages = [{"role": "user", "content": "Hi"}]
-    result = await manager.summarize_conversation(messages)
-    assert result == "Conversation summary unavailable"
-    await manager.close()
+    assert await manager.summarize_conversation(messages) == expected
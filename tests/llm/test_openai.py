@@ -5,87 +5,87 @@
 
 # pylint: disable=missing-return-doc,missing-param-doc,missing-yield-doc
 # pylint: disable=missing-function-docstring,missing-class-docstring
-from unittest.mock import AsyncMock, MagicMock, patch
+from collections import namedtuple
+from typing import Any, AsyncGenerator
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from eva.llm._openai import OpenAILLMManager
-from eva.models import ChatMessage
 
+_OpenAIResponse = namedtuple("_OpenAIResponse", "output_text")
 
-@pytest.mark.asyncio
-@patch("eva.llm._openai.openai")
-async def test_openai_manager_parses_json(mock_openai: AsyncMock) -> None:
-    """Test that the OpenAI LLM manager correctly parses JSON responses."""
-    # Build a mock response object with output_text as the LLM's JSON string
-    mock_response = MagicMock()
-    mock_response.output_text = """
-    {
-        "segments": [
-            {"content": "Hi!", "emotion": "curious"}
-        ]
-    }
-    """
-
-    # Patch the client's async responses.create method
-    #  to return the mock_response
-    mock_client = AsyncMock()
-    mock_client.responses.create.return_value = mock_response
-    mock_openai.AsyncOpenAI.return_value = mock_client
 
-    manager = OpenAILLMManager()
-    messages = [{"role": "user", "content": "test"}]
-    chunks: list[ChatMessage] = []
-    async for chunk in await manager.generate_response(messages):
-        chunks.append(chunk)
-    assert chunks[0].content == "Hi!"
-    assert chunks[0].emotion == "curious"
+@pytest.fixture(name="openai")
+async def openai_fixture() -> (
+    AsyncGenerator[tuple[OpenAILLMManager, AsyncMock], None]
+):
+    """OpenAI LLM manager with a mocked client."""
+    with patch("eva.llm._openai.openai") as mock_openai:
+        mock_client = AsyncMock()
+        mock_openai.AsyncOpenAI.return_value = mock_client
+        manager = OpenAILLMManager()
+        yield manager, mock_client
+        await manager.close()
 
 
 @pytest.mark.asyncio
-@patch("eva.llm._openai.openai")
-async def test_openai_generate_response_error(mock_openai: AsyncMock) -> None:
-    """Test that OpenAI LLM manager handles errors gracefully."""
-    mock_client = AsyncMock()
-    mock_client.responses.create.side_effect = Exception("boom")
-    mock_openai.AsyncOpenAI.return_value = mock_client
-
-    manager = OpenAILLMManager()
+@pytest.mark.parametrize(
+    ("outcome", "content", "emotion"),
+    [
+        (
+            _OpenAIResponse(
+                output_text="""
+                {
+                    "segments": [
+                        {"content": "Hi!", "emotion": "curious"}
+                    ]
+                }
+                """
+            ),
+            "Hi!",
+            "curious",
+        ),
+        (Exception("boom"), "Error generating response: boom", "concerned"),
+    ],
+    ids=["parses_json", "error"],
+)
+async def test_openai_generate_response(
+    openai: tuple[OpenAILLMManager, AsyncMock],
+    outcome: Any,
+    content: str,
+    emotion: str,
+) -> None:
+    """Test generating (and parsing) responses, or handling errors."""
+    manager, mock_client = openai
+    mock_client.responses.create.side_effect = [outcome]
     messages = [{"role": "user", "content": "test"}]
-    gen = await manager.generate_response(messages)
-    chunks = [chunk async for chunk in gen]
-    assert any("Error generating response" in c.content for c in chunks)
+    chunks = [
+        chunk async for chunk in await manager.generate_response(messages)
+    ]
+    assert chunks[0].content == content
+    assert chunks[0].emotion == emotion
 
 
 @pytest.mark.asyncio
-@patch("eva.llm._openai.openai")
-async def test_openai_summarize_conversation(mock_openai: AsyncMock) -> None:
-    """Test that OpenAI LLM manager summarizes conversation correctly."""
-    # Simulate OpenAI returning a summary string
-    mock_response = MagicMock()
-    mock_response.output_text = "This is the summary."
-    mock_client = AsyncMock()
-    mock_client.responses.create.return_value = mock_response
-    mock_openai.AsyncOpenAI.return_value = mock_client
-
-    manager = OpenAILLMManager()
-    messages = [{"role": "user", "content": "Hello"}]
-    result = await manager.summarize_conversation(messages)
-    assert result == "This is the summary."
-
-
-@pytest.mark.asyncio
-@patch("eva.llm._openai.openai")
-async def test_openai_summarize_conversation_error(
-    mock_openai: AsyncMock,
+@pytest.mark.parametrize(
+    ("outcome", "expected"),
+    [
+        (
+            _OpenAIResponse(output_text="This is the summary."),
+            "This is the summary.",
+        ),
+        (Exception("fail!"), "Conversation summary unavailable"),
+    ],
+    ids=["summary", "error"],
+)
+async def test_openai_summarize_conversation(
+    openai: tuple[OpenAILLMManager, AsyncMock],
+    outcome: Any,
+    expected: str,
 ) -> None:
-    """Test that OpenAI LLM manager handles errors in summarization."""
-    mock_client = AsyncMock()
-    mock_client.responses.create.side_effect = Exception("fail!")
-    mock_openai.AsyncOpenAI.return_value = mock_client
-
-    manager = OpenAILLMManager()
+    """Test summarizing a conversation, or handling errors."""
+    manager, mock_client = openai
+    mock_client.responses.create.side_effect = [outcome]
     messages = [{"role": "user", "content": "Hello"}]
-    result = await manager.summarize_conversation(messages)
-    assert result == "Conversation summary unavailable"
-    await manager.close()
+    assert await manager.summarize_conversation(messages) == expected
@@ -0,0 +1,24 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2025 Thingenious.
+
+"""Shared setup for the eva.rag tests."""
+
+# pylint: disable=import-outside-toplevel
+import sys
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_up_chroma_fixture() -> None:
+    """Start the in-memory chroma system before the first test uses it.
+
+    Only if a collected test module already imported chromadb, so that
+    narrow runs (e.g. ``-k``) do not pay for it.
+    """
+    if "chromadb" in sys.modules:
+        import chromadb
+
+        from eva.rag._chroma_local import client_settings
+
+        chromadb.Client(settings=client_settings("", persistent=False))
@@ -13,24 +13,38 @@ import pytest
 from eva.rag._base import BaseRAGManager
 
 
-@pytest.fixture(name="base_manager")
+@pytest.fixture(name="base_manager", scope="session")
 def base_manager_fixture() -> BaseRAGManager:
-    """Create a BaseRAGManager instance for testing."""
+    """Create a BaseRAGManager instance shared by the tests.
+
+    The manager is stateless (besides its logger); tests that patch it
+    use the function-scoped monkeypatch, which is undone after each test.
+    """
     return BaseRAGManager()  # type: ignore[abstract]
 
 
 @pytest.mark.asyncio
-async def test_manager_extract_text(
+@pytest.mark.parametrize(
+    ("name", "content", "expected"),
+    [
+        ("a.txt", "async test", "async test"),
+        ("a.json", '{"foo": "bar"}', "JSON File: a.json\nfoo: bar"),
+        ("a.unsupported", "should not work", ""),
+    ],
+    ids=["txt", "json", "unsupported"],
+)
+async def test_extract_text_from_file(
     tmp_path: Path,
     base_manager: BaseRAGManager,
+    name: str,
+    content: str,
+    expected: str,
 ) -> None:
-    """Test that BaseRAGManager can extract text from a file."""
-    file = tmp_path / "q.txt"
-    file.write_text("async test")
-    # sync version
-    assert base_manager.extract_text_from_file(file) == "async test"
-    # async version
-    assert await base_manager.a_extract_text_from_file(file) == "async test"
+    """Test extracting text from files, synchronously and asynchronously."""
+    file = tmp_path / name
+    file.write_text(content)
+    assert base_manager.extract_text_from_file(file) == expected
+    assert await base_manager.a_extract_text_from_file(file) == expected
 
 
 def test_manager_get_supported_files(
@@ -52,59 +66,6 @@ def test_get_supported_files_invalid_path(base_manager: BaseRAGManager) -> None:
         base_manager._get_supported_files(Path("doesnotexist"))
 
 
-@pytest.mark.asyncio
-async def test_a_extract_text_from_file(
-    tmp_path: Path,
-    base_manager: BaseRAGManager,
-) -> None:
-    """Test that a_extract_text_from_file works with various file types."""
-    # Uses a simple text file
-    file = tmp_path / "hello.txt"
-    file.write_text("Some text here")
-    result = await base_manager.a_extract_text_from_file(file)
-    assert isinstance(result, str)
-    assert "Some text here" in result
-
-
-def test_extract_text_from_file_txt(
-    tmp_path: Path,
-    base_manager: BaseRAGManager,
-) -> None:
-    """Test extracting text from a simple text file."""
-    file = tmp_path / "a.txt"
-    file.write_text("X")
-    assert base_manager.extract_text_from_file(file) == "X"
-
-
-def test_extract_text_from_file_json(
-    tmp_path: Path,
-    base_manager: BaseRAGManager,
-) -> None:
-    """Test extracting text from a JSON file."""
-    file = tmp_path / "a.json"
-    file.write_text('{"foo": "bar"}')
-    result = base_manager.extract_text_from_file(file)
-    assert "foo: bar" in result
-
-
-def test_extract_text_from_file_unsupported(
-    tmp_path: Path,
-    base_manager: BaseRAGManager,
-) -> None:
-    """Test extracting text from an unsupported file type."""
-    file = tmp_path / "a.unsupported"
-    file.write_text("should not work")
-    result = base_manager.extract_text_from_file(file)
-    assert result == ""
-
-
-def test_split_text_empty(
-    base_manager: BaseRAGManager,
-) -> None:
-    """Test splitting empty text."""
-    assert base_manager.split_text("", chunk_size=10, overlap=2) == []
-
-
 def test_get_supported_files_file_unsupported(
     tmp_path: Path,
     base_manager: BaseRAGManager,
@@ -179,16 +140,24 @@ def test_extract_text_from_file_loader_exception(
     )
     result = base_manager.extract_text_from_file(file)
     assert result == ""
+    # unlike an empty file, the failure can be told apart
+    assert base_manager.try_extract_text_from_file(file) is None
 
 
-def test_split_text_one_chunk(
+@pytest.mark.parametrize(
+    ("text", "chunk_size", "overlap", "expected"),
+    [("", 10, 2, []), ("abc", 10, 0, ["abc"])],
+    ids=["empty", "one_chunk"],
+)
+def test_split_text_short(
     base_manager: BaseRAGManager,
+    text: str,
+    chunk_size: int,
+    overlap: int,
+    expected: list[str],
 ) -> None:
-    """Test splitting text that is smaller than chunk size."""
-    # Text smaller than chunk_size
-    text = "abc"
-    result = base_manager.split_text(text, 10, 0)
-    assert result == ["abc"]
+    """Test splitting empty text, or text smaller than the chunk size."""
+    assert base_manager.split_text(text, chunk_size, overlap) == expected
 
 
 def test_split_text_breakpoints(
@@ -201,3 +170,89 @@ def test_split_text_breakpoints(
     result = base_manager.split_text(text, 12, 2)
     assert all(isinstance(chunk, str) for chunk in result)
     assert any("." in chunk or "\n" in chunk for chunk in result)
+
+
+@pytest.mark.asyncio
+async def test_extract_texts_from_files(
+    tmp_path: Path,
+    base_manager: BaseRAGManager,
+) -> None:
+    """Test extracting the text of multiple files, preserving order."""
+    files = [tmp_path / f"{i}.txt" for i in range(5)]
+    for i, file in enumerate(files):
+        file.write_text(f"text {i}")
+    expected = [f"text {i}" for i in range(5)]
+    assert base_manager.extract_texts_from_files(files) == expected
+    assert await base_manager.a_extract_texts_from_files(files) == expected
+    assert base_manager.extract_texts_from_files([]) == []
+
+
+def test_embed_texts_preserves_order(base_manager: BaseRAGManager) -> None:
+    """Test that length-sorted batch embedding keeps the input order."""
+    calls: list[list[str]] = []
+
+    def embedding_function(texts: list[str]) -> list[list[float]]:
+        calls.append(texts)
+        return [[float(len(text))] for text in texts]
+
+    texts = ["ccc", "a", "bbbb", "dd"]
+    result = base_manager.embed_texts(embedding_function, texts, batch_size=3)
+    assert result == [[3.0], [1.0], [4.0], [2.0]]
+    assert calls == [["a", "dd", "ccc"], ["bbbb"]]
+
+
+@pytest.mark.asyncio
+async def test_iter_chunks(
+    tmp_path: Path,
+    base_manager: BaseRAGManager,
+) -> None:
+    """Test lazily extracting and chunking multiple files."""
+    files = [tmp_path / f"{i}.txt" for i in range(3)]
+    for i, file in enumerate(files):
+        file.write_text(f"text {i}" if i else "")
+    chunks = list(base_manager.iter_chunks(files, 100, 10))
+    assert [chunk for chunk, _, _ in chunks] == ["text 1", "text 2"]
+    metadata = chunks[0][1]
+    assert metadata["file_name"] == "1.txt"
+    assert metadata["chunk_id"] == 0
+    assert metadata["file_size"] == len("text 1")
+    async_chunks = [
+        item async for item in base_manager.a_iter_chunks(files, 100, 10)
+    ]
+    assert [chunk for chunk, _, _ in async_chunks] == ["text 1", "text 2"]
+
+
+def test_iter_file_chunks_unique_ids(
+    tmp_path: Path,
+    base_manager: BaseRAGManager,
+) -> None:
+    """Test that chunk ids stay unique across files and loads."""
+    file = tmp_path / "same.txt"
+    file.write_text("One. Two. Three. Four.")
+    ids = [
+        doc_id
+        for _ in range(2)
+        for _, _, doc_id in base_manager.iter_file_chunks(
+            file, file.read_text(), 6, 0
+        )
+    ]
+    assert len(ids) > 2
+    assert len(set(ids)) == len(ids)
+    assert all(doc_id.startswith("same_") for doc_id in ids)
+
+
+def test_get_supported_files_with_stats(
+    tmp_path: Path,
+    base_manager: BaseRAGManager,
+) -> None:
+    """Test walking nested directories with the files' stat results."""
+    nested = tmp_path / "a" / "b"
+    nested.mkdir(parents=True)
+    (tmp_path / "top.txt").write_text("top")
+    (nested / "deep.MD").write_text("deeper")
+    (nested / "skip.weird").write_text("no")
+    found = base_manager._get_supported_files_with_stats(tmp_path)
+    assert {path.name: stat.st_size for path, stat in found.items()} == {
+        "top.txt": 3,
+        "deep.MD": 6,
+    }
@@ -0,0 +1,49 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2025 Thingenious.
+
+"""Tests for the approximate query cache."""
+
+# pylint: disable=missing-return-doc,missing-param-doc,missing-yield-doc
+# pylint: disable=missing-function-docstring
+
+from eva.rag._cache import QueryCache
+
+
+def test_query_cache_hit_on_similar_query() -> None:
+    """Test that a similar query returns the cached results."""
+    cache = QueryCache(capacity=4, threshold=0.05)
+    results = [{"content": "cats", "id": "1"}, {"content": "dogs", "id": "2"}]
+    cache.store([1.0, 0.0, 0.0], 2, results)
+    assert cache.lookup([0.99, 0.01, 0.0], 2) == results
+    assert cache.lookup([0.99, 0.01, 0.0], 1) == results[:1]
+
+
+def test_query_cache_miss() -> None:
+    """Test cache misses on dissimilar queries or too few results."""
+    cache = QueryCache(capacity=4, threshold=0.05)
+    cache.store([1.0, 0.0, 0.0], 2, [{"content": "cats", "id": "1"}])
+    assert cache.lookup([0.0, 1.0, 0.0], 2) is None
+    assert cache.lookup([1.0, 0.0, 0.0], 3) is None
+    assert cache.lookup([0.0, 0.0, 0.0], 2) is None
+    cache.clear()
+    assert cache.lookup([1.0, 0.0, 0.0], 2) is None
+
+
+def test_query_cache_evicts_least_recently_used() -> None:
+    """Test that the least recently used entry is evicted."""
+    cache = QueryCache(capacity=2, threshold=0.05)
+    cache.store([1.0, 0.0, 0.0], 1, [{"id": "x"}])
+    cache.store([0.0, 1.0, 0.0], 1, [{"id": "y"}])
+    assert cache.lookup([1.0, 0.0, 0.0], 1) == [{"id": "x"}]
+    cache.store([0.0, 0.0, 1.0], 1, [{"id": "z"}])
+    assert len(cache) == 2
+    assert cache.lookup([0.0, 1.0, 0.0], 1) is None
+    assert cache.lookup([1.0, 0.0, 0.0], 1) == [{"id": "x"}]
+
+
+def test_query_cache_disabled() -> None:
+    """Test that a zero capacity disables the cache."""
+    cache = QueryCache(capacity=0)
+    cache.store([1.0, 0.0], 1, [{"id": "x"}])
+    assert not cache
+    assert cache.lookup([1.0, 0.0], 1) is None
@@ -7,99 +7,158 @@
 # pylint: disable=missing-function-docstring,import-outside-toplevel
 # pyright: reportUnknownArgumentType=false,reportUnknownLambdaType=false
 # pyright: reportUnknownVariableType=false
-import os
+import zlib
 from pathlib import Path
+from typing import Any, AsyncIterator, Iterator
 
 import pytest
 
 from eva.rag._chroma_local import ChromaLocalRAGManager
+from eva.rag._embeddings import get_embedding_function
+from eva.rag.loader import DocumentLoader
 
+# the documents shared by the search tests, indexed once
+_INDEXED_FILES = {
+    "file.txt": "Cats are beautiful animals. Dogs are loyal companions.",
+    "alpha.txt": "Alpha alpha.",
+    "beta.txt": "Beta beta.",
+    "gamma.txt": "Gamma gamma.",
+}
 
-@pytest.fixture(name="chroma_manager")
-def chroma_manager_fixture(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> ChromaLocalRAGManager:
-    """Create a ChromaLocalRAGManager instance with dummy embedding."""
+
+# pylint: disable=too-few-public-methods
+class DummyEmbeddingFunction:
+    """Dummy embedding function that hashes words into a small vector."""
+
+    # pylint: disable=redefined-builtin
+    def __call__(self, input: list[str]) -> list[list[float]]:
+        """Return a bag of hashed words for each text.
+
+        (deterministic, texts sharing words are similar)
+        """
+        vectors: list[list[float]] = []
+        for text in input:
+            vector = [0.0] * 16
+            for word in text.lower().replace(".", " ").split():
+                vector[zlib.crc32(word.encode()) % len(vector)] += 1.0
+            vectors.append(vector)
+        return vectors
+
+
+@pytest.fixture(scope="module", autouse=True)
+def dummy_embeddings_fixture() -> Iterator[None]:
+    """Use the dummy embedding function in all the tests of this module."""
     import chromadb.utils.embedding_functions as ef
 
-    # pylint: disable=too-few-public-methods
-    class DummyEmbeddingFunction:
-        """Dummy embedding function that returns fixed vectors."""
-
-        # pylint: disable=redefined-builtin
-        def __call__(self, input: list[str]) -> list[list[float]]:
-            # Return a vector of length 3, value based on text length
-            #  (just for deterministic variety)
-            return [[float(len(t)) % 10 for _ in range(3)] for t in input]
-
-    # Patch the factory to always return our dummy
-    monkeypatch.setattr(
-        ef,
-        "SentenceTransformerEmbeddingFunction",
-        lambda *args, **kwargs: DummyEmbeddingFunction(),
-    )
+    with pytest.MonkeyPatch.context() as patch:
+        # Patch the factory to always return our dummy
+        patch.setattr(
+            ef,
+            "SentenceTransformerEmbeddingFunction",
+            lambda *args, **kwargs: DummyEmbeddingFunction(),
+        )
+        # do not reuse (or leave behind) cached embedding functions
+        get_embedding_function.cache_clear()
+        yield
+        get_embedding_function.cache_clear()
+
 
+@pytest.fixture(name="chroma_manager")
+async def chroma_manager_fixture(
+    tmp_path: Path,
+) -> AsyncIterator[tuple[ChromaLocalRAGManager, Path]]:
+    """Create an in-memory ChromaLocalRAGManager and its documents dir."""
+    docs = tmp_path / "documents"
+    docs.mkdir()
     manager = ChromaLocalRAGManager(
         persist_directory=str(tmp_path / "chroma_db"),
-        documents_root=str(tmp_path / "documents"),
+        documents_root=str(docs),
+        persistent=False,
     )
-    os.makedirs(manager.documents_root, exist_ok=True)
-    return manager
-
-
-@pytest.mark.asyncio
-async def test_end_to_end_index_and_search(
-    chroma_manager: ChromaLocalRAGManager,
-) -> None:
-    """Test end-to-end indexing and searching functionality."""
-    # 1. Create a sample file to index
-    file = Path(chroma_manager.documents_root) / "file.txt"
-    file.write_text("Cats are beautiful animals. Dogs are loyal companions.")
+    yield manager, docs
+    await manager.close()
+    if manager.client:
+        # in-memory clients share one system, drop what this test added
+        manager.client.delete_collection(manager.collection_name)
 
-    # 2. Initialize and load the document
-    await chroma_manager.initialize()
 
-    # 3. Search for 'cats'
-    results = await chroma_manager.search("cats", n_results=2)
-    assert isinstance(results, list)
-    assert any("cats" in r["content"].lower() for r in results)
-    # 4. Search for something not present
-    results2 = await chroma_manager.search("hamster", n_results=2)
-    assert results2 == [] or all(
-        "hamster" not in r["content"].lower() for r in results2
+@pytest.fixture(name="indexed_chroma_manager", scope="module")
+async def indexed_chroma_manager_fixture(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> AsyncIterator[ChromaLocalRAGManager]:
+    """Create an in-memory ChromaLocalRAGManager with indexed documents."""
+    tmp_path = tmp_path_factory.mktemp("indexed")
+    docs = tmp_path / "documents"
+    docs.mkdir()
+    for name, text in _INDEXED_FILES.items():
+        (docs / name).write_text(text, encoding="utf-8")
+    manager = ChromaLocalRAGManager(
+        persist_directory=str(tmp_path / "chroma_db"),
+        collection_name="eve_rag_indexed",
+        documents_root=str(docs),
+        persistent=False,
     )
+    await manager.initialize()
+    yield manager
+    await manager.close()
+    if manager.client:
+        manager.client.delete_collection(manager.collection_name)
 
 
 @pytest.mark.asyncio
-async def test_multiple_files_indexing(
-    chroma_manager: ChromaLocalRAGManager,
+@pytest.mark.parametrize(
+    ("query", "n_results", "expected"),
+    [
+        ("cats", 2, "cats"),
+        ("beta", 1, "beta"),
+        ("hamster", 2, None),
+    ],
+    ids=["cats", "beta", "not_present"],
+)
+async def test_search_indexed_documents(
+    indexed_chroma_manager: ChromaLocalRAGManager,
+    query: str,
+    n_results: int,
+    expected: str | None,
 ) -> None:
-    """Test indexing and searching across multiple files."""
-    # Write multiple files
-
-    (Path(chroma_manager.documents_root) / "alpha.txt").write_text(
-        "Alpha alpha.", encoding="utf-8"
-    )
-    (Path(chroma_manager.documents_root) / "beta.txt").write_text(
-        "Beta beta.", encoding="utf-8"
-    )
-    (Path(chroma_manager.documents_root) / "gamma.txt").write_text(
-        "Gamma gamma.", encoding="utf-8"
-    )
-    await chroma_manager.initialize()
-    results = await chroma_manager.search("beta")
-    assert any("beta" in r["content"].lower() for r in results)
+    """Test searching the documents indexed once for the module."""
+    results = await indexed_chroma_manager.search(query, n_results=n_results)
+    assert isinstance(results, list)
+    assert len(results) <= n_results
+    contents = [r["content"].lower() for r in results]
+    if expected:
+        assert any(expected in content for content in contents)
+    else:
+        assert all(query not in content for content in contents)
 
 
 @pytest.mark.asyncio
-async def test_empty_directory(chroma_manager: ChromaLocalRAGManager) -> None:
+async def test_empty_directory(
+    chroma_manager: tuple[ChromaLocalRAGManager, Path],
+) -> None:
     """Test behavior when loading an empty directory."""
-    await chroma_manager.initialize()
+    manager, _ = chroma_manager
+    await manager.initialize()
     # No exception, nothing to index, search returns nothing
-    results = await chroma_manager.search("anything")
+    results = await manager.search("anything")
     assert results == []
 
 
+@pytest.mark.asyncio
+async def test_in_memory_manifest(
+    chroma_manager: tuple[ChromaLocalRAGManager, Path],
+) -> None:
+    """Test that an in-memory collection leaves nothing on disk."""
+    manager, docs = chroma_manager
+    (docs / "alpha.txt").write_text("Alpha alpha.", encoding="utf-8")
+    await manager.initialize()
+    assert manager.manifest is not None
+    assert manager.manifest.sources() == {str(docs / "alpha.txt")}
+    assert not Path(manager.persist_directory).exists()
+    await manager.close()
+    assert manager.manifest is None
+
+
 @pytest.mark.asyncio
 async def test_search_before_init_raises(tmp_path: Path) -> None:
     """Test that searching before initialization raises an error."""
@@ -118,3 +177,157 @@ async def test_load_before_init_raises(tmp_path: Path) -> None:
     )
     with pytest.raises(RuntimeError):
         await manager.load_documents(str(tmp_path))
+
+
+@pytest.mark.asyncio
+async def test_reload_only_changed_files(
+    chroma_manager: tuple[ChromaLocalRAGManager, Path],
+) -> None:
+    """Test that reloading skips unchanged files and drops stale chunks."""
+    manager, root = chroma_manager
+    (root / "alpha.txt").write_text("Alpha alpha.", encoding="utf-8")
+    (root / "beta.txt").write_text("Beta beta.", encoding="utf-8")
+    await manager.initialize()
+    assert manager.collection is not None
+    assert manager.collection.count() == 2
+    alpha_ids = manager.collection.get(where={"file_name": "alpha.txt"})["ids"]
+
+    # unchanged files are not loaded again
+    await manager.reload_documents()
+    assert manager.collection.count() == 2
+
+    # modified files are replaced, removed files are dropped
+    (root / "beta.txt").unlink()
+    (root / "alpha.txt").write_text("Alpha alpha alpha.", encoding="utf-8")
+    (root / "gamma.txt").write_text("Gamma gamma.", encoding="utf-8")
+    await manager.reload_documents()
+    remaining = manager.collection.get(include=["metadatas"])
+    assert sorted(
+        str(metadata["file_name"]) for metadata in remaining["metadatas"] or []
+    ) == ["alpha.txt", "gamma.txt"]
+    assert not set(alpha_ids) & set(remaining["ids"])
+
+
+@pytest.mark.asyncio
+async def test_reload_skips_files_without_chunks(
+    chroma_manager: tuple[ChromaLocalRAGManager, Path],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that files with no chunks are not extracted on every reload."""
+    manager, root = chroma_manager
+    (root / "alpha.txt").write_text("Alpha alpha.", encoding="utf-8")
+    (root / "empty.txt").write_text("", encoding="utf-8")
+    await manager.initialize()
+    extracted: list[Path] = []
+    extract = manager.try_extract_text_from_file
+
+    def counting_extract(file_path: Path) -> str | None:
+        extracted.append(file_path)
+        return extract(file_path)
+
+    monkeypatch.setattr(manager, "try_extract_text_from_file", counting_extract)
+    await manager.reload_documents()
+    assert not extracted
+
+
+@pytest.mark.asyncio
+async def test_reload_retries_files_that_failed_to_load(
+    chroma_manager: tuple[ChromaLocalRAGManager, Path],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a file that could not be loaded is loaded on reload."""
+    manager, root = chroma_manager
+    (root / "alpha.txt").write_text("Alpha alpha.", encoding="utf-8")
+    (root / "beta.txt").write_text("Beta beta.", encoding="utf-8")
+    load = DocumentLoader.load
+
+    def failing_load(file_path: Path) -> str:
+        if file_path.name == "beta.txt":
+            raise OSError("busy")
+        return load(file_path)
+
+    monkeypatch.setattr(DocumentLoader, "load", staticmethod(failing_load))
+    await manager.initialize()
+    assert manager.collection is not None
+    assert manager.collection.count() == 1
+
+    monkeypatch.setattr(DocumentLoader, "load", staticmethod(load))
+    await manager.reload_documents()
+    remaining = manager.collection.get(include=["metadatas"])
+    assert sorted(
+        str(metadata["file_name"]) for metadata in remaining["metadatas"] or []
+    ) == ["alpha.txt", "beta.txt"]
+
+
+@pytest.mark.asyncio
+async def test_reload_partially_loaded_file(
+    chroma_manager: tuple[ChromaLocalRAGManager, Path],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a file whose chunks were not all added is loaded again."""
+    manager, root = chroma_manager
+    manager.chunk_size = 20
+    manager.chunk_overlap = 0
+    manager.chunk_batch_size = 2
+    (root / "alpha.txt").write_text(" ".join(["Alpha."] * 30), "utf-8")
+    add_chunks = manager._add_chunks  # pylint: disable=protected-access
+    batches: list[int] = []
+
+    def failing_add_chunks(*args: Any) -> None:
+        batches.append(len(batches))
+        if len(batches) == 2:
+            raise RuntimeError("interrupted")
+        add_chunks(*args)
+
+    monkeypatch.setattr(manager, "_add_chunks", failing_add_chunks)
+    with pytest.raises(RuntimeError):
+        await manager.initialize()
+    assert manager.collection is not None
+    assert manager.collection.count() == 2
+
+    monkeypatch.setattr(manager, "_add_chunks", add_chunks)
+    await manager.reload_documents()
+    expected = len(list(manager.iter_chunks([root / "alpha.txt"], 20, 0)))
+    assert expected > 4
+    assert manager.collection.count() == expected
+
+
+@pytest.mark.asyncio
+async def test_collection_hnsw_params(
+    chroma_manager: tuple[ChromaLocalRAGManager, Path],
+) -> None:
+    """Test that new collections get the (overridable) HNSW params."""
+    manager, _ = chroma_manager
+    assert manager.hnsw_params["hnsw:space"] == "cosine"
+    manager.hnsw_params["hnsw:search_ef"] = 128
+    await manager.initialize()
+    assert manager.collection is not None
+    metadata = manager.collection.metadata
+    assert metadata
+    assert metadata["hnsw:space"] == "cosine"
+    assert metadata["hnsw:search_ef"] == 128
+    assert metadata["hnsw:batch_size"] == 10000
+
+
+@pytest.mark.asyncio
+async def test_reload_before_init_loads_once(
+    chroma_manager: tuple[ChromaLocalRAGManager, Path],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that reloading an uninitialized manager loads documents once."""
+    manager, docs = chroma_manager
+    (docs / "alpha.txt").write_text("Alpha alpha.", encoding="utf-8")
+    loads: list[str] = []
+    load_documents = manager.load_documents
+
+    async def counting_load(documents_path: str) -> None:
+        loads.append(documents_path)
+        await load_documents(documents_path)
+
+    monkeypatch.setattr(manager, "load_documents", counting_load)
+    await manager.reload_documents()
+    assert loads == [manager.documents_root]
+    await manager.reload_documents()
+    assert len(loads) == 2
+    assert manager.collection is not None
+    assert manager.collection.count() == 1
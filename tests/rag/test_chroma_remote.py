@@ -0,0 +1,96 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2025 Thingenious.
+
+"""Test cases for ChromaRemoteRAGManager document loading."""
+
+# pylint: disable=missing-return-doc,missing-param-doc,missing-yield-doc
+# pylint: disable=missing-function-docstring,too-few-public-methods
+# pylint: disable=missing-raises-doc
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from eva.rag._chroma_remote import ChromaRemoteRAGManager
+
+
+class FakeAsyncCollection:
+    """Fake AsyncCollection that tracks the adds in flight.
+
+    Parameters
+    ----------
+    fail_on : int | None
+        The (1-based) add call that raises, if any.
+        If set, the other adds never complete unless cancelled.
+    """
+
+    def __init__(self, fail_on: int | None = None) -> None:
+        self.fail_on = fail_on
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled = 0
+        self.added: list[str] = []
+
+    async def add(self, ids: list[str], **_: Any) -> None:
+        """Add the chunks (after a while, or never)."""
+        self.calls += 1
+        if self.calls == self.fail_on:
+            raise RuntimeError("server error")
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.fail_on is None:
+                await asyncio.sleep(0.01)
+            else:
+                await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+        self.added.extend(ids)
+
+
+def _remote_manager(
+    docs: Path, collection: FakeAsyncCollection, max_concurrent_batches: int
+) -> ChromaRemoteRAGManager:
+    """Create a manager with a fake collection, one chunk per batch."""
+    for i in range(6):
+        (docs / f"file{i}.txt").write_text(f"Text {i}.", encoding="utf-8")
+    manager = ChromaRemoteRAGManager(
+        documents_root=str(docs),
+        chunk_batch_size=1,
+        max_concurrent_batches=max_concurrent_batches,
+    )
+    # no embedding function, the chunks are added as they are
+    manager.collection = collection  # type: ignore[assignment]
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_load_documents_overlaps_batches(tmp_path: Path) -> None:
+    """Test that up to max_concurrent_batches batches are added at once."""
+    collection = FakeAsyncCollection()
+    manager = _remote_manager(tmp_path, collection, max_concurrent_batches=2)
+    await manager.load_documents(str(tmp_path))
+    assert collection.max_in_flight == 2
+    assert len(collection.added) == 6
+    assert collection.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_load_documents_cancels_batches_on_failure(
+    tmp_path: Path,
+) -> None:
+    """Test that the batches in flight are cancelled if one add fails."""
+    collection = FakeAsyncCollection(fail_on=2)
+    manager = _remote_manager(tmp_path, collection, max_concurrent_batches=3)
+    with pytest.raises(RuntimeError, match="server error"):
+        await manager.load_documents(str(tmp_path))
+    # no more batches are submitted after the failure
+    assert collection.calls < 6
+    assert collection.cancelled == collection.calls - 1
+    assert collection.in_flight == 0
+    assert not collection.added
@@ -0,0 +1,160 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2025 Thingenious.
+
+"""Tests for the RAG embedding functions."""
+
+# pylint: disable=missing-return-doc,missing-param-doc,missing-yield-doc
+# pylint: disable=missing-function-docstring,protected-access
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import chromadb.utils.embedding_functions as ef
+import numpy as np
+import onnx
+import onnxruntime  # type: ignore[import-untyped]
+import pytest
+
+from eva.rag._embeddings import (
+    _convert,
+    _ONNXEmbeddingFunction,
+    _quantize,
+    get_embedding_function,
+)
+
+
+def test_get_embedding_function_onnx() -> None:
+    """Test that the onnx backend is used for all-MiniLM-L6-v2."""
+    embedding_function = get_embedding_function(
+        "sentence-transformers/all-MiniLM-L6-v2", backend="onnx"
+    )
+    assert isinstance(embedding_function, _ONNXEmbeddingFunction)
+    assert embedding_function._preferred_providers
+    assert embedding_function._preferred_providers[-1] == (
+        "CPUExecutionProvider"
+    )
+
+
+def test_onnx_prefers_cuda_when_available(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the CUDA execution provider is preferred if available."""
+    monkeypatch.setattr(
+        onnxruntime,
+        "get_available_providers",
+        lambda: ["CUDAExecutionProvider", "CPUExecutionProvider"],
+    )
+    assert _ONNXEmbeddingFunction().uses_cuda
+    monkeypatch.setattr(
+        onnxruntime,
+        "get_available_providers",
+        lambda: ["CPUExecutionProvider"],
+    )
+    assert not _ONNXEmbeddingFunction().uses_cuda
+
+
+def test_get_embedding_function_onnx_fallback(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the sentence-transformers fallback for other models."""
+    sentinel = object()
+    monkeypatch.setattr(
+        ef,
+        "SentenceTransformerEmbeddingFunction",
+        lambda *args, **kwargs: sentinel,
+    )
+    get_embedding_function.cache_clear()
+    assert get_embedding_function("all-mpnet-base-v2", "onnx") is sentinel
+    get_embedding_function.cache_clear()
+
+
+def test_get_embedding_function_is_cached() -> None:
+    """Test that managers share the embedding function of a model."""
+    first = get_embedding_function("all-MiniLM-L6-v2", "onnx")
+    assert get_embedding_function("all-MiniLM-L6-v2", "onnx") is first
+    get_embedding_function.cache_clear()
+    assert get_embedding_function("all-MiniLM-L6-v2", "onnx") is not first
+
+
+def test_convert_falls_back_to_fp32(tmp_path: Path) -> None:
+    """Test that a model that cannot be converted is used as is."""
+    model_path = tmp_path / "model.onnx"
+    model_path.write_bytes(b"not a model")
+    quantized_path = tmp_path / "model_qint8.onnx"
+    assert _convert(model_path, quantized_path, _quantize) == model_path
+    # no truncated (or temporary) model is left behind
+    assert list(tmp_path.iterdir()) == [model_path]
+    quantized_path.write_bytes(b"cached")
+    assert _convert(model_path, quantized_path, _quantize) == quantized_path
+
+
+def _write_matmul_model(model_path: Path) -> None:
+    """Write a small FP32 model with a weight initializer to quantize."""
+    weights = onnx.numpy_helper.from_array(
+        np.random.default_rng(0).random((64, 64), dtype=np.float32), "W"
+    )
+    graph = onnx.helper.make_graph(
+        [onnx.helper.make_node("MatMul", ["X", "W"], ["Y"])],
+        "matmul",
+        [
+            onnx.helper.make_tensor_value_info(
+                "X", onnx.TensorProto.FLOAT, [1, 64]
+            )
+        ],
+        [
+            onnx.helper.make_tensor_value_info(
+                "Y", onnx.TensorProto.FLOAT, [1, 64]
+            )
+        ],
+        [weights],
+    )
+    onnx.save(onnx.helper.make_model(graph), str(model_path))
+
+
+def test_quantized_model_is_created_and_loaded(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the CPU session loads the int8 copy of the model."""
+    model_dir = tmp_path / _ONNXEmbeddingFunction.EXTRACTED_FOLDER_NAME
+    model_dir.mkdir()
+    _write_matmul_model(model_dir / "model.onnx")
+    monkeypatch.setattr(_ONNXEmbeddingFunction, "DOWNLOAD_PATH", tmp_path)
+    embedding_function = _ONNXEmbeddingFunction(["CPUExecutionProvider"])
+    session = embedding_function.model
+    quantized_path = model_dir / _ONNXEmbeddingFunction.QUANTIZED_MODEL_NAME
+    assert quantized_path.exists()
+    assert session._model_path == str(quantized_path)
+    assert any(
+        initializer.data_type == onnx.TensorProto.INT8
+        for initializer in onnx.load(str(quantized_path)).graph.initializer
+    )
+    output = session.run(None, {"X": np.ones((1, 64), dtype=np.float32)})
+    assert output[0].shape == (1, 64)
+
+
+def test_model_is_converted_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that concurrent first uses convert the model only once."""
+    model_dir = tmp_path / _ONNXEmbeddingFunction.EXTRACTED_FOLDER_NAME
+    model_dir.mkdir()
+    _write_matmul_model(model_dir / "model.onnx")
+    monkeypatch.setattr(_ONNXEmbeddingFunction, "DOWNLOAD_PATH", tmp_path)
+    conversions: list[Path] = []
+
+    def counting_quantize(model_path: Path, output_path: Path) -> None:
+        conversions.append(output_path)
+        _quantize(model_path, output_path)
+
+    monkeypatch.setattr("eva.rag._embeddings._quantize", counting_quantize)
+    embedding_function = _ONNXEmbeddingFunction(["CPUExecutionProvider"])
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        sessions = list(
+            executor.map(lambda _: embedding_function.model, range(4))
+        )
+    assert len(conversions) == 1
+    assert conversions[0].name != _ONNXEmbeddingFunction.QUANTIZED_MODEL_NAME
+    assert all(session is sessions[0] for session in sessions)
+    assert sorted(path.name for path in model_dir.iterdir()) == [
+        "model.onnx",
+        _ONNXEmbeddingFunction.QUANTIZED_MODEL_NAME,
+    ]
@@ -8,11 +8,30 @@
 # pylint: disable=missing-function-docstring,missing-class-docstring
 # pylint: disable=import-outside-toplevel,too-few-public-methods
 # pylint: disable=unused-argument,invalid-name,no-self-use
+import shutil
+import sys
 from pathlib import Path
+from typing import Any
 
 import pytest
 
-from eva.rag.loader import DocumentLoader, _extract_text_from_element
+from eva.rag import loader as loader_mod
+from eva.rag.loader import (
+    DocumentLoader,
+    _extract_text_from_element,
+    _json_to_text,
+    _load_odt_with_odfpy,
+)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+# files that are only read, shared by the tests
+_SAMPLES = {
+    "doc.md": "# Heading\n\nBody text",
+    "doc.json": '{"foo": "bar", "num": 42}',
+    "sample.txt": "hello world",
+    "sample.md": "# Header\nBody",
+    "sample.json": '{"foo": 123, "bar": [1,2]}',
+}
 
 
 @pytest.fixture(name="loader")
@@ -29,20 +48,25 @@ def tmp_txt_file_fixture(tmp_path: Path) -> Path:
     return file
 
 
-@pytest.fixture(name="tmp_md_file")
-def tmp_md_file_fixture(tmp_path: Path) -> Path:
-    """Fixture to create a temporary Markdown file."""
-    file = tmp_path / "doc.md"
-    file.write_text("# Heading\n\nBody text")
-    return file
+@pytest.fixture(name="samples_dir", scope="session")
+def samples_dir_fixture(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Fixture to create the read-only sample files once per session."""
+    path = tmp_path_factory.mktemp("samples")
+    for name, content in _SAMPLES.items():
+        (path / name).write_text(content)
+    return path
 
 
-@pytest.fixture(name="tmp_json_file")
-def tmp_json_file_fixture(tmp_path: Path) -> Path:
-    """Fixture to create a temporary JSON file."""
-    file = tmp_path / "doc.json"
-    file.write_text('{"foo": "bar", "num": 42}')
-    return file
+@pytest.fixture(name="tmp_md_file", scope="session")
+def tmp_md_file_fixture(samples_dir: Path) -> Path:
+    """Fixture to get a (read-only) Markdown file."""
+    return samples_dir / "doc.md"
+
+
+@pytest.fixture(name="tmp_json_file", scope="session")
+def tmp_json_file_fixture(samples_dir: Path) -> Path:
+    """Fixture to get a (read-only) JSON file."""
+    return samples_dir / "doc.json"
 
 
 @pytest.fixture(name="tmp_csv_file")
@@ -59,6 +83,22 @@ def test_load_txt_file(loader: DocumentLoader, tmp_txt_file: Path) -> None:
     assert "Hello, world!" in content
 
 
+def test_load_txt_file_mmap(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test loading a memory-mapped text file."""
+    monkeypatch.setattr(loader_mod, "MMAP_MIN_SIZE", 8)
+    file = tmp_path / "large.txt"
+    file.write_bytes("Größere\r\nDatei\rmit Zeilen\n".encode("utf-8"))
+    expected = file.read_text(encoding="utf-8")
+    assert (
+        loader_mod.load_txt(file) == expected == "Größere\nDatei\nmit Zeilen\n"
+    )
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    assert not loader_mod.load_txt(empty)
+
+
 def test_load_md_file(loader: DocumentLoader, tmp_md_file: Path) -> None:
     """Test loading a Markdown file."""
     content = loader.load(tmp_md_file)
@@ -71,12 +111,33 @@ def test_load_json_file(loader: DocumentLoader, tmp_json_file: Path) -> None:
     assert "foo" in content and "bar" in content
 
 
+def test_load_json_file_lenient(tmp_path: Path) -> None:
+    """Test loading JSON that only the stdlib parser accepts."""
+    file = tmp_path / "lenient.json"
+    file.write_text('{"value": NaN, "big": 123456789012345678901234567890}')
+    content = DocumentLoader.load(file)
+    assert "value: nan" in content
+    assert "big: 123456789012345678901234567890" in content
+
+
 def test_load_csv_file(loader: DocumentLoader, tmp_csv_file: Path) -> None:
     """Test loading a CSV file."""
     content = loader.load(tmp_csv_file)
     assert "Alice,30" in content
 
 
+def test_load_csv_file_normalized(tmp_csv_file: Path) -> None:
+    """Test normalizing a CSV file with pandas."""
+    pytest.importorskip("pandas")
+    from eva.rag.loader import load_csv
+
+    content = load_csv(tmp_csv_file, normalize=True)
+    assert content.splitlines() == ["name,age", "Alice,30", "Bob,22"]
+    tmp_csv_file.write_text('id,note\n007,"a, b"\n010,NA')
+    content = load_csv(tmp_csv_file, normalize=True)
+    assert content.splitlines() == ["id,note", '007,"a, b"', "010,NA"]
+
+
 def test_load_unsupported_filetype(
     loader: DocumentLoader, tmp_path: Path
 ) -> None:
@@ -97,66 +158,100 @@ def test_load_missing_file(loader: DocumentLoader, tmp_path: Path) -> None:
 def test_load_docx_file(loader: DocumentLoader, tmp_path: Path) -> None:
     """Test loading a DOCX file."""
     pytest.importorskip("docx")
+    file = tmp_path / "doc.docx"
+    shutil.copyfile(FIXTURES_DIR / "sample.docx", file)
+    content = loader.load(file)
+    assert "Docx text" in content
+
+
+def test_load_docx_file_streamed(tmp_path: Path) -> None:
+    """Test that streaming a DOCX file matches python-docx."""
+    pytest.importorskip("lxml.etree")
+    pytest.importorskip("docx")
     from docx import Document
 
-    file = tmp_path / "doc.docx"
+    from eva.rag.loader import load_docx
+
+    file = tmp_path / "rich.docx"
     doc = Document()
-    doc.add_paragraph("Docx text")
+    doc.add_paragraph("First")
+    paragraph = doc.add_paragraph("Tab\there")
+    run = paragraph.add_run("more")
+    run.add_break()
+    run.add_text("after break")
+    doc.add_paragraph("")
+    doc.add_table(rows=1, cols=1).cell(0, 0).text = "in a table"
+    doc.add_paragraph("Last")
     doc.save(str(file))
-    content = loader.load(file)
-    assert "Docx text" in content
+    expected = "\n".join(
+        p.text for p in Document(str(file)).paragraphs if p.text
+    )
+    assert load_docx(file) == expected
+    assert expected == "First\nTab\theremore\nafter break\nLast"
 
 
 def test_load_odt_file(loader: DocumentLoader, tmp_path: Path) -> None:
     """Test loading an ODT file."""
     pytest.importorskip("odf.opendocument")
-    from odf.opendocument import OpenDocumentText  # type: ignore
-    from odf.text import P  # type: ignore
-
     file = tmp_path / "doc.odt"
-    doc = OpenDocumentText()
-    doc.text.addElement(P(text="ODT text"))  # pyright: ignore
-    doc.save(str(file))  # pyright: ignore
+    shutil.copyfile(FIXTURES_DIR / "sample.odt", file)
     content = loader.load(file)
     assert "ODT text" in content
 
 
+# pylint: disable=too-many-locals
+def test_load_odt_file_with_table(
+    loader: DocumentLoader, tmp_path: Path
+) -> None:
+    """Test streaming the paragraphs and tables of an ODT file."""
+    pytest.importorskip("lxml.etree")
+    file = tmp_path / "table.odt"
+    shutil.copyfile(FIXTURES_DIR / "table.odt", file)
+    content = loader.load(file)
+    assert content.startswith("ODT Document: table.odt\nHello world\n")
+    assert "Outro" in content
+    assert content.endswith("\nTable:\nr0c0 | r0c1\nr1c0 | r1c1")
+
+
+def test_load_odt_file_with_footnote(tmp_path: Path) -> None:
+    """Test that a paragraph keeps the text of its footnote, like odfpy."""
+    pytest.importorskip("lxml.etree")
+    pytest.importorskip("odf.opendocument")
+    file = tmp_path / "footnote.odt"
+    shutil.copyfile(FIXTURES_DIR / "footnote.odt", file)
+    content = loader_mod.load_odt(file)
+    assert content == (
+        "ODT Document: footnote.odt\nIntro\n"
+        "Main text1Footnote text continues.\nFootnote text\nOutro"
+    )
+    assert content == _load_odt_with_odfpy(file)
+
+
 def test_pdf_loader(tmp_path: Path) -> None:
     """Test loading a PDF file."""
     pytest.importorskip("pymupdf")
-    from fpdf import FPDF
-
     pdf_file = tmp_path / "sample.pdf"
-    pdf = FPDF()
-    pdf.add_page()
-    pdf.set_font("Arial", size=12)
-    pdf.cell(200, 10, "Hello PDF", ln=True)
-    pdf.output(str(pdf_file))
+    shutil.copyfile(FIXTURES_DIR / "sample.pdf", pdf_file)
 
     # Should not crash and must mention file name
     out = DocumentLoader.load(pdf_file)
     assert "PDF Document: sample.pdf" in out
+    assert "Hello PDF" in out
 
 
-def test_loader_txt(tmp_path: Path) -> None:
+def test_loader_txt(samples_dir: Path) -> None:
     """Test loading a text file."""
-    path = tmp_path / "sample.txt"
-    path.write_text("hello world")
-    assert DocumentLoader.load(path) == "hello world"
+    assert DocumentLoader.load(samples_dir / "sample.txt") == "hello world"
 
 
-def test_loader_md(tmp_path: Path) -> None:
+def test_loader_md(samples_dir: Path) -> None:
     """Test loading a Markdown file."""
-    path = tmp_path / "sample.md"
-    path.write_text("# Header\nBody")
-    assert DocumentLoader.load(path) == "# Header\nBody"
+    assert DocumentLoader.load(samples_dir / "sample.md") == "# Header\nBody"
 
 
-def test_loader_json(tmp_path: Path) -> None:
+def test_loader_json(samples_dir: Path) -> None:
     """Test loading a JSON file."""
-    path = tmp_path / "sample.json"
-    path.write_text('{"foo": 123, "bar": [1,2]}')
-    result = DocumentLoader.load(path)
+    result = DocumentLoader.load(samples_dir / "sample.json")
     assert "foo: 123" in result
     assert "bar:" in result
 
@@ -175,52 +270,38 @@ def test_loader_unsupported(tmp_path: Path) -> None:
         DocumentLoader.load(path)
 
 
-def test_loader_csv_import_error(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    """Test that loading a CSV file raises ImportError."""
-    path = tmp_path / "file.csv"
-    path.write_text("a,b\n1,2")
-    monkeypatch.setitem(__import__("sys").modules, "pandas", None)
-    from importlib import reload
-
-    import eva.rag.loader as loader_mod
-
-    reload(loader_mod)
-    with pytest.raises(ImportError):
-        loader_mod.load_csv(path)
-
-
-def test_loader_docx_import_error(
-    tmp_path: Path,
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Test that loading a DOCX file raises ImportError."""
-    path = tmp_path / "file.docx"
-    monkeypatch.setitem(__import__("sys").modules, "docx", None)
-    from importlib import reload
-
-    import eva.rag.loader as loader_mod
-
-    reload(loader_mod)
-    with pytest.raises(ImportError):
-        loader_mod.load_docx(path)
-
-
-def test_loader_odt_import_error(
+@pytest.mark.parametrize(
+    ("missing", "loader_name", "kwargs", "expected"),
+    [
+        (("pandas",), "load_csv", {}, "a,b\n1,2"),
+        (("pandas",), "load_csv", {"normalize": True}, ImportError),
+        (("lxml", "docx"), "load_docx", {}, ImportError),
+        # odfpy missing: logged, not raised
+        (("lxml", "odf.opendocument"), "load_odt", {}, ""),
+    ],
+    ids=["csv", "csv_normalize", "docx", "odt"],
+)
+def test_loader_import_error(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
+    missing: tuple[str, ...],
+    loader_name: str,
+    kwargs: dict[str, Any],
+    expected: str | type[Exception],
 ) -> None:
-    """Test that loading an ODT file raises ImportError."""
-    path = tmp_path / "file.odt"
-    monkeypatch.setitem(__import__("sys").modules, "odf.opendocument", None)
-    from importlib import reload
-
-    import eva.rag.loader as loader_mod
-
-    reload(loader_mod)
-    # Should not raise, just log and return ""
-    assert loader_mod.load_odt(path) == ""
+    """Test loading files when optional dependencies are missing."""
+    # the loaders import them on use, no need to reload the module
+    for module in missing:
+        monkeypatch.setitem(sys.modules, module, None)
+    suffix = loader_name.removeprefix("load_")
+    path = tmp_path / f"file.{suffix}"
+    path.write_text("a,b\n1,2")
+    load = getattr(loader_mod, loader_name)
+    if isinstance(expected, str):
+        assert load(path, **kwargs) == expected
+    else:
+        with pytest.raises(expected):
+            load(path, **kwargs)
 
 
 def test_extract_text_from_element_basic() -> None:
@@ -246,80 +327,78 @@ def test_extract_text_from_element_recursive() -> None:
     assert _extract_text_from_element(p) == "barbar"
 
 
-# pylint: disable=too-complex
-def test_loader_odt_table(  # noqa: C901
-    tmp_path: Path,
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Test loading an ODT file with a table using a mocked odfpy API."""
-    path = tmp_path / "file.odt"
-    path.write_text("does not matter")
-
-    class DummyP:
-        def __init__(self, txt: str) -> None:
-            """Initialize a dummy paragraph with text."""
-            self.data = txt
-
-    class DummyCell:
-        def __init__(self, txt: str) -> None:
-            """Initialize a dummy cell with text."""
-            self.childNodes = [DummyP(txt)]
-
-    class DummyRow:
-        def getElementsByType(self, typ: str) -> list[DummyCell]:
-            """Simulate the ODF table row structure."""
-            return [DummyCell("cell1"), DummyCell("cell2")]
-
-    class DummyTable:
-        def getElementsByType(self, typ: str) -> list[DummyRow]:
-            """Simulate the ODF table structure."""
-            return [DummyRow()]
-
-    class DummyDoc:
-        def getElementsByType(
-            self, typ: str
-        ) -> list[DummyP | DummyTable | DummyRow | DummyCell]:
-            """Simulate the ODF document structure."""
-            if typ.__name__ == "P":  # type: ignore
-                return [DummyP("par1")]
-            if typ.__name__ == "Table":  # type: ignore
-                return [DummyTable()]
-            if typ.__name__ == "TableRow":  # type: ignore
-                return [DummyRow()]
-            if typ.__name__ == "TableCell":  # type: ignore
-                return [DummyCell("cellX")]
-            return []
-
-    class DummyODF:
-        @staticmethod
-        def load(p: Path) -> "DummyDoc":
-            """Simulate loading an ODT document."""
-            return DummyDoc()
-
-    import types
-
-    dummy_mod = types.SimpleNamespace(
-        load=DummyODF.load,
-        Table=type("Table", (), {}),
-        TableCell=type("TableCell", (), {}),
-        TableRow=type("TableRow", (), {}),
-    )
-    monkeypatch.setitem(
-        __import__("sys").modules, "odf.opendocument", dummy_mod
-    )
-    monkeypatch.setitem(__import__("sys").modules, "odf.table", dummy_mod)
-    monkeypatch.setitem(
-        __import__("sys").modules,
-        "odf.text",
-        types.SimpleNamespace(P=type("P", (), {})),
-    )
-    from importlib import reload
+def test_extract_text_from_element_nested() -> None:
+    """Test text extraction from nested odfpy and lxml elements."""
+
+    class Text:
+        def __init__(self, data: str) -> None:
+            self.data = data
+
+    class Node:
+        def __init__(self, *children: object) -> None:
+            self.childNodes = list(children)
+
+    paragraph = Node(Text(" Hello "), Node(Node(Text("big")), Text(" ")))
+    paragraph.childNodes.append(Text("world "))
+    assert _extract_text_from_element(paragraph) == "Hello big world"
 
-    import eva.rag.loader as loader_mod
+    etree = pytest.importorskip("lxml.etree")
+    element = etree.fromstring("<p> Hello <span>big</span> world </p>")
+    assert _extract_text_from_element(element) == "Hello big world"
 
-    reload(loader_mod)
-    # Should include 'ODT Document', 'par1', 'Table:'
-    result = loader_mod.load_odt(path)
-    assert "ODT Document" in result
-    assert "par1" in result
-    assert "Table:" in result
+
+def test_loader_odt_table(tmp_path: Path) -> None:
+    """Test the odfpy fallback on an ODT file with a table."""
+    pytest.importorskip("odf.opendocument")
+    file = tmp_path / "table.odt"
+    shutil.copyfile(FIXTURES_DIR / "table.odt", file)
+    result = _load_odt_with_odfpy(file)
+    assert result.startswith("ODT Document: table.odt\nHello world\n")
+    assert result.endswith("\nTable:\nr0c0 | r0c1\nr1c0 | r1c1")
+    assert result == loader_mod.load_odt(file)
+
+
+def test_load_many_keeps_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test loading several files concurrently."""
+    paths: list[Path] = []
+    for i in range(5):
+        path = tmp_path / f"doc{i}.txt"
+        path.write_text(f"content {i}")
+        paths.append(path)
+    monkeypatch.setenv("EVA_LOADER_WORKERS", "2")
+    assert DocumentLoader.load_many(paths) == [f"content {i}" for i in range(5)]
+    assert not DocumentLoader.load_many([])
+    with pytest.raises(FileNotFoundError):
+        DocumentLoader.load_many([tmp_path / "missing.txt"], max_workers=1)
+
+
+def test_json_to_text_flat() -> None:
+    """Test converting flat JSON objects and arrays to text."""
+    assert _json_to_text({"a": 1, "b": None}) == "a: 1\nb: None"
+    assert _json_to_text(["x", 2]) == "Item 1: x\nItem 2: 2"
+    assert _json_to_text({}) == ""
+
+
+def test_json_to_text_nested() -> None:
+    """Test converting nested JSON to text."""
+    data = {"a": {"b": [1, {"c": 2}], "d": {}}, "e": "f"}
+    assert _json_to_text(data) == "\n".join(
+        [
+            "a:",
+            "  b:",
+            "    Item 1: 1",
+            "    Item 2:",
+            "      c: 2",
+            "  d:",
+            "",
+            "e: f",
+        ]
+    )
+    deep: dict[str, Any] = {}
+    node = deep
+    for _ in range(5000):
+        node["a"] = {}
+        node = node["a"]
+    assert _json_to_text(deep).count("a:") == 5000
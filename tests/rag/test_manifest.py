@@ -0,0 +1,48 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2025 Thingenious.
+
+"""Tests for the loaded files manifest."""
+
+# pylint: disable=missing-return-doc,missing-param-doc,missing-yield-doc
+# pylint: disable=missing-function-docstring
+from pathlib import Path
+
+from eva.rag._manifest import FileManifest
+
+
+def test_file_manifest(tmp_path: Path) -> None:
+    """Test recording, checking and removing loaded files."""
+    manifest = FileManifest(tmp_path / "db" / "manifest.sqlite3")
+    manifest.add_chunks([("a.txt", "a_0"), ("a.txt", "a_1")])
+    # partially loaded files are known, but not unchanged
+    assert manifest.sources() == {"a.txt"}
+    assert not manifest.is_unchanged("a.txt", 1.0, 10)
+    manifest.add_files([("a.txt", 1.0, 10), ("empty.txt", 3.0, 0)])
+    manifest.add_chunks([("b.txt", "b_0")])
+    manifest.add_files([("b.txt", 2.0, 20)])
+    assert manifest.sources() == {"a.txt", "b.txt", "empty.txt"}
+    assert manifest.is_unchanged("a.txt", 1.0, 10)
+    assert manifest.is_unchanged("empty.txt", 3.0, 0)
+    assert not manifest.is_unchanged("a.txt", 1.5, 10)
+    assert not manifest.is_unchanged("a.txt", 1.0, 11)
+    assert not manifest.is_unchanged("c.txt", 1.0, 10)
+    assert sorted(manifest.chunk_ids(["a.txt", "c.txt"])) == ["a_0", "a_1"]
+    manifest.remove(["a.txt", "empty.txt"])
+    assert manifest.sources() == {"b.txt"}
+    assert not manifest.is_unchanged("a.txt", 1.0, 10)
+    manifest.close()
+
+    manifest = FileManifest(tmp_path / "db" / "manifest.sqlite3")
+    assert manifest.is_unchanged("b.txt", 2.0, 20)
+    manifest.clear()
+    assert not manifest.sources()
+    assert not manifest.is_unchanged("b.txt", 2.0, 20)
+    manifest.close()
+
+
+def test_file_manifest_in_memory() -> None:
+    """Test a manifest that is not stored in a file."""
+    manifest = FileManifest()
+    manifest.add_files([("a.txt", 1.0, 10)])
+    assert manifest.is_unchanged("a.txt", 1.0, 10)
+    manifest.close()
@@ -10,12 +10,103 @@
 # pylint: disable=too-few-public-methods,protected-access
 
 from pathlib import Path
-from typing import Any, Iterable
+from types import SimpleNamespace
+from typing import Any, Iterable, Sequence
 
 import pymupdf  # type: ignore[import-untyped]
 import pytest
 
-from eva.rag._pdf import PDFLoader, _extract_single_table, _is_valid_table_row
+from eva.rag._pdf import (
+    PDFLoader,
+    _extract_single_table,
+    _page_might_have_table,
+)
+
+# a drawn rectangle (four table cell borders)
+_GRID_DRAWINGS: list[dict[str, Any]] = [
+    {"items": [("re", pymupdf.Rect(0, 0, 10, 10), 1)]}
+]
+
+
+class DummyTableRow(list[Any]):
+    """Behaves like a list, for table row emulation."""
+
+
+class DummyTable:
+    """Dummy table class for testing."""
+
+    def __init__(self, should_fail: bool = False) -> None:
+        """Initialize with an option to simulate extraction failure."""
+        self.should_fail = should_fail
+
+    def extract(self) -> list[DummyTableRow]:
+        """Simulate table extraction."""
+        if self.should_fail:
+            raise Exception("Extract fail")
+        # Return two rows, one valid, one empty
+        return [
+            DummyTableRow(["cell1", "cell2", ""]),
+            DummyTableRow(["", "", ""]),
+        ]
+
+
+class _DummyGridPage:
+    """A page with some text and the borders of a table."""
+
+    def __init__(self, tables: Iterable[DummyTable] = ()) -> None:
+        """Initialize with the tables to find on the page."""
+        self.tables = list(tables)
+
+    def get_text(self, *args: Any) -> str:
+        """Simulate page text extraction."""
+        return "Some text"
+
+    def get_drawings(self) -> list[dict[str, Any]]:
+        """Simulate page vector graphics extraction."""
+        return _GRID_DRAWINGS
+
+    def find_tables(self, **kwargs: Any) -> SimpleNamespace:
+        """Simulate finding tables on the page."""
+        return SimpleNamespace(tables=self.tables)
+
+
+class StubPyMuPDFDoc:
+    """A ``pymupdf.Document`` stand-in that can fail at each step."""
+
+    def __init__(
+        self,
+        metadata_exc: Exception | None = None,
+        page_exc: Exception | None = None,
+        close_exc: Exception | None = None,
+        pages: Sequence[_DummyGridPage] = (),
+    ) -> None:
+        """Initialize with the pages and the errors to raise."""
+        self.metadata_exc = metadata_exc
+        self.page_exc = page_exc
+        self.close_exc = close_exc
+        self.pages = pages
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        """Simulate the document metadata."""
+        if self.metadata_exc:
+            raise self.metadata_exc
+        return {}
+
+    def close(self) -> None:
+        """Simulate closing the document."""
+        if self.close_exc:
+            raise self.close_exc
+
+    def __len__(self) -> int:
+        """Get the number of pages."""
+        return len(self.pages)
+
+    def __getitem__(self, idx: int) -> _DummyGridPage:
+        """Get a page."""
+        if self.page_exc:
+            raise self.page_exc
+        return self.pages[idx]
 
 
 def test_pdfloader_file_not_found(tmp_path: Path) -> None:
@@ -29,20 +120,8 @@ def test_pdfloader_metadata_error(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     """Test that PDFLoader handles metadata extraction errors gracefully."""
-    # Patch pymupdf.open and doc.metadata to throw an exception
-
-    class DummyDoc:
-        metadata = property(
-            lambda self: (_ for _ in ()).throw(Exception("fail"))
-        )
-
-        def close(self) -> None:
-            pass
-
-        def __len__(self) -> int:
-            return 0
-
-    monkeypatch.setattr(pymupdf, "open", lambda _: DummyDoc())
+    doc = StubPyMuPDFDoc(metadata_exc=Exception("fail"))
+    monkeypatch.setattr(pymupdf, "open", lambda _: doc)
     result = PDFLoader.load(tmp_path / "some.pdf")
     assert "PDF Document" in result  # still basic info present
 
@@ -51,21 +130,10 @@ def test_pdfloader_page_content_error(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     """Test that PDFLoader handles page content extraction errors gracefully."""
-
-    class DummyDoc:
-        metadata: dict[str, Any] = {}
-
-        def close(self) -> None:
-            pass
-
-        def __len__(self) -> int:
-            return 1
-
-        def __getitem__(self, idx: int) -> Any:
-            # pylint: disable=broad-exception-raised
-            raise Exception("page error")
-
-    monkeypatch.setattr(pymupdf, "open", lambda _: DummyDoc())
+    doc = StubPyMuPDFDoc(
+        page_exc=Exception("page error"), pages=[_DummyGridPage()]
+    )
+    monkeypatch.setattr(pymupdf, "open", lambda _: doc)
     result = PDFLoader.load(tmp_path / "any.pdf")
     assert "Error: Could not extract content from this page" in result
 
@@ -74,17 +142,8 @@ def test_pdfloader_close_error(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     """Test that PDFLoader handles document close errors gracefully."""
-
-    class DummyDoc:
-        metadata: dict[str, Any] = {}
-
-        def close(self) -> None:
-            raise Exception("fail on close")
-
-        def __len__(self) -> int:
-            return 0
-
-    monkeypatch.setattr(pymupdf, "open", lambda _: DummyDoc())
+    doc = StubPyMuPDFDoc(close_exc=Exception("fail on close"))
+    monkeypatch.setattr(pymupdf, "open", lambda _: doc)
     PDFLoader.load(tmp_path / "close.pdf")  # Should not raise
 
 
@@ -92,117 +151,24 @@ def test_pdfloader_table_extraction_success(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     """Test that PDFLoader handles table extraction successfully."""
-
-    class DummyGoodTable:
-        """Table class that simulates successful extraction."""
-
-        def extract(self) -> str:
-            """Simulate table extraction."""
-            raise Exception("table fail")
-
-    class DummyPage:
-        def get_text(self) -> str:
-            """Simulate page text extraction."""
-            return "Some text"
-
-        def find_tables(self) -> Any:
-            """Simulate finding tables on the page."""
-            return type("Tables", (), {"tables": [DummyGoodTable()]})()
-
-    class DummyDoc:
-        metadata: dict[str, Any] = {}
-
-        def close(self) -> None:
-            pass
-
-        def __len__(self) -> int:
-            return 1
-
-        def __getitem__(self, idx: int) -> DummyPage:
-            """Return a dummy page with table extraction failure."""
-            return DummyPage()
-
-    monkeypatch.setattr(pymupdf, "open", lambda _: DummyDoc())
+    doc = StubPyMuPDFDoc(pages=[_DummyGridPage([DummyTable()])])
+    monkeypatch.setattr(pymupdf, "open", lambda _: doc)
     result = PDFLoader.load(tmp_path / "table.pdf")
     assert "Some text" in result
+    assert "Table 1 on Page 1:\ncell1 | cell2 | " in result
 
 
 def test_pdfloader_table_extraction_error(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     """Test PDFLoader handles table extraction errors gracefully."""
-
-    # pylint: disable=too-few-public-methods
-    class DummyBadTable:
-        """Table class that raises on extract."""
-
-        def extract(self) -> str:
-            raise Exception("table fail")
-
-    class DummyPage:
-        def get_text(self) -> str:
-            """Simulate page text extraction."""
-            return "Some text"
-
-        def find_tables(self) -> Any:
-            """Simulate finding tables on the page."""
-
-            # Must have .tables property nonempty, and be iterable!
-            class TablesObj:
-                tables = [DummyBadTable()]
-
-                def __iter__(self) -> Iterable[DummyBadTable]:
-                    return iter(self.tables)
-
-                def __len__(self) -> int:
-                    return len(self.tables)
-
-                def __getitem__(self, idx: int) -> DummyBadTable:
-                    return self.tables[idx]
-
-            return TablesObj()
-
-    class DummyDoc:
-        metadata: dict[str, Any] = {}
-
-        def close(self) -> None:
-            pass
-
-        def __len__(self) -> int:
-            return 1
-
-        def __getitem__(self, idx: int) -> DummyPage:
-            return DummyPage()
-
-    monkeypatch.setattr(pymupdf, "open", lambda _: DummyDoc())
-
+    doc = StubPyMuPDFDoc(pages=[_DummyGridPage([DummyTable(should_fail=True)])])
+    monkeypatch.setattr(pymupdf, "open", lambda _: doc)
     result = PDFLoader.load(tmp_path / "table.pdf")
-
+    assert "Some text" in result
     assert "Error: Could not extract table data" in result
 
 
-class DummyTableRow(list[Any]):
-    """Behaves like a list, for table row emulation."""
-
-
-class DummyTable:
-    """Dummy table class for testing."""
-
-    def __init__(self, should_fail: bool = False) -> None:
-        """Initialize with an option to simulate extraction failure."""
-        self.should_fail = should_fail
-
-    def extract(self) -> list[DummyTableRow]:
-        """Simulate table extraction."""
-        if self.should_fail:
-            raise Exception("Extract fail")
-        # Return two rows, one valid, one empty
-        return [
-            DummyTableRow(["cell1", "cell2", ""]),
-            DummyTableRow(["", "", ""]),
-        ]
-
-
 def test_extract_single_table_success() -> None:
     """Test that _extract_single_table extracts valid rows correctly."""
     table = DummyTable()
@@ -232,13 +198,44 @@ def test_extract_single_table_handles_error() -> None:
     ]
 
 
-def test_is_valid_table_row_true() -> None:
-    """Test that _is_valid_table_row correctly identifies valid rows."""
-    assert _is_valid_table_row(["foo", ""]) is True
-    assert _is_valid_table_row(["", "bar"]) is True
+def test_extract_single_table_skips_empty_rows() -> None:
+    """Test that rows without any non-blank cell are skipped."""
+
+    class Table:
+        def extract(self) -> list[list[Any]]:
+            return [[None, " "], [], ["", "bar "], [" foo", None]]
 
+    result = _extract_single_table(Table(), table_num=0, page_num=0)
+    assert result == ["Table 1 on Page 1:", " | bar", "foo | "]
 
-def test_is_valid_table_row_false() -> None:
-    """Test that _is_valid_table_row correctly identifies invalid rows."""
-    assert not _is_valid_table_row(["", ""])
-    assert not _is_valid_table_row([])
+
+def test_pdfloader_pages_in_order(tmp_path: Path) -> None:
+    """Test that the pages of a real document are extracted in order."""
+    file = tmp_path / "pages.pdf"
+    doc = pymupdf.open()
+    for page_num in range(5):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Content of page number {page_num + 1}")
+    doc.save(file)
+    doc.close()
+    result = PDFLoader.load(file)
+    assert "Pages: 5" in result
+    positions = [
+        result.index(f"page number {page_num + 1}") for page_num in range(5)
+    ]
+    assert positions == sorted(positions)
+
+
+def test_page_might_have_table() -> None:
+    """Test the table hint from the vector graphics of a page."""
+    assert _page_might_have_table(_GRID_DRAWINGS)
+    doc = pymupdf.open()
+    page = doc.new_page()
+    for line in range(5):
+        page.insert_text((72, 72 + line * 20), f"Just text, line {line}.")
+    page.draw_line((72, 200), (300, 200))
+    assert not _page_might_have_table(page.get_drawings())
+    for column in range(3):
+        page.draw_line((72 + column * 50, 220), (72 + column * 50, 300))
+    assert _page_might_have_table(page.get_drawings())
+    doc.close()
@@ -7,6 +7,9 @@
 # pylint: disable=missing-return-doc,missing-param-doc,missing-yield-doc
 # pylint: disable=missing-function-docstring,missing-class-docstring
 
+from functools import partial
+from typing import Callable
+
 import pytest
 
 from eva.auth import (
@@ -23,6 +26,8 @@ from eva.auth import (
 class DummyWS:
     """Simple mock to simulate WebSocket object for auth extraction."""
 
+    __slots__ = ("cookies", "query_params", "headers")
+
     def __init__(
         self,
         cookies: dict[str, str] | None = None,
@@ -38,78 +43,96 @@ class DummyWS:
 # --- Individual extractors ---
 
 
-def test_get_token_from_cookie() -> None:
-    """Test extracting token from WebSocket cookies."""
-    ws = DummyWS(cookies={"token": "abc123"})
-    assert get_token_from_cookie(ws)[0] == "abc123"
-    ws = DummyWS(cookies={})
-    assert get_token_from_cookie(ws)[0] is None
-
-
-def test_get_token_from_query_params() -> None:
-    """Test extracting token from WebSocket query parameters."""
-    ws = DummyWS(query_params={"token": "xyz789"})
-    assert get_token_from_query_params(ws)[0] == "xyz789"
-    ws = DummyWS(query_params={})
-    assert get_token_from_query_params(ws)[0] is None
-
-
-def test_get_token_from_auth_header() -> None:
-    """Test extracting token from WebSocket authorization header."""
-    ws = DummyWS(headers={"authorization": "Bearer secret42"})
-    assert get_token_from_auth_header(ws, "")[0] == "secret42"
-    ws = DummyWS(headers={"authorization": "Token whatevar"})
-    assert get_token_from_auth_header(ws, "")[0] is None
-    ws = DummyWS(headers={})
-    assert get_token_from_auth_header(ws, "")[0] is None
-
-
-def test_get_token_from_subprotocol() -> None:
-    """Test extracting token from WebSocket subprotocol header."""
-    # Should parse "prefix, actualtoken"
-    ws = DummyWS(headers={"sec-websocket-protocol": "myproto, subtok"})
-    assert get_token_from_subprotocol(ws)[0] == "subtok"
-    ws = DummyWS(headers={"sec-websocket-protocol": "myproto"})
-    assert get_token_from_subprotocol(ws)[0] is None
-    ws = DummyWS(headers={})
-    assert get_token_from_subprotocol(ws)[0] is None
+@pytest.mark.parametrize(
+    ("extractor", "kwargs", "expected"),
+    [
+        (get_token_from_cookie, {"cookies": {"token": "abc123"}}, "abc123"),
+        (get_token_from_cookie, {"cookies": {}}, None),
+        (
+            get_token_from_query_params,
+            {"query_params": {"token": "xyz789"}},
+            "xyz789",
+        ),
+        (get_token_from_query_params, {"query_params": {}}, None),
+        (
+            partial(get_token_from_auth_header, _=""),
+            {"headers": {"authorization": "Bearer secret42"}},
+            "secret42",
+        ),
+        (
+            partial(get_token_from_auth_header, _=""),
+            {"headers": {"authorization": "Token whatevar"}},
+            None,
+        ),
+        (partial(get_token_from_auth_header, _=""), {"headers": {}}, None),
+        # should parse "prefix, actualtoken"
+        (
+            get_token_from_subprotocol,
+            {"headers": {"sec-websocket-protocol": "myproto, subtok"}},
+            "subtok",
+        ),
+        (
+            get_token_from_subprotocol,
+            {"headers": {"sec-websocket-protocol": "myproto"}},
+            None,
+        ),
+        (get_token_from_subprotocol, {"headers": {}}, None),
+    ],
+    ids=[
+        "cookie",
+        "cookie_missing",
+        "query",
+        "query_missing",
+        "auth_header",
+        "auth_header_not_bearer",
+        "auth_header_missing",
+        "subprotocol",
+        "subprotocol_no_token",
+        "subprotocol_missing",
+    ],
+)
+def test_get_token_from(
+    extractor: Callable[[DummyWS], tuple[str | None, str | None]],
+    kwargs: dict[str, dict[str, str]],
+    expected: str | None,
+) -> None:
+    """Test extracting a token with each individual extractor."""
+    assert extractor(DummyWS(**kwargs))[0] == expected
 
 
 # --- Full extraction logic ---
 
 
-def test_extract_ws_token_priority() -> None:
+@pytest.mark.parametrize(
+    ("headers", "query", "cookies", "expected"),
+    [
+        (
+            {"authorization": "Bearer topsecret"},
+            {"token": "in_query"},
+            {"token": "in_cookie"},
+            "topsecret",
+        ),
+        (
+            {"sec-websocket-protocol": "chat, fromsub"},
+            {"token": "fromquery"},
+            {"token": "fromcookie"},
+            "fromsub",
+        ),
+        (None, {"token": "fromquery"}, {"token": "fromcookie"}, "fromquery"),
+        (None, None, {"token": "fromcookie"}, "fromcookie"),
+        (None, None, None, None),
+    ],
+    ids=["auth_header", "subprotocol", "query", "cookie", "none"],
+)
+def test_extract_ws_token_priority(
+    headers: dict[str, str] | None,
+    query: dict[str, str] | None,
+    cookies: dict[str, str] | None,
+    expected: str | None,
+) -> None:
     """Test the full token extraction logic with priority order."""
-    # 1. Auth header (priority)
-    ws = DummyWS(
-        headers={"authorization": "Bearer topsecret"},
-        query_params={"token": "in_query"},
-        cookies={"token": "in_cookie"},
-    )
-    assert extract_ws_token(ws)[0] == "topsecret"
-
-    # 2. Subprotocol (second)
-    ws = DummyWS(
-        headers={"sec-websocket-protocol": "chat, fromsub"},
-        query_params={"token": "fromquery"},
-        cookies={"token": "fromcookie"},
-    )
-    assert extract_ws_token(ws)[0] == "fromsub"
-
-    # 3. Query param
-    ws = DummyWS(
-        query_params={"token": "fromquery"},
-        cookies={"token": "fromcookie"},
-    )
-    assert extract_ws_token(ws)[0] == "fromquery"
-
-    # 4. Cookie
-    ws = DummyWS(cookies={"token": "fromcookie"})
-    assert extract_ws_token(ws)[0] == "fromcookie"
-
-    # 5. None found
-    ws = DummyWS()
-    assert extract_ws_token(ws)[0] is None
+    ws = DummyWS(cookies=cookies, query_params=query, headers=headers)
+    assert extract_ws_token(ws)[0] == expected
 
 
 def test_extract_ws_token_with_custom_subprotocol() -> None:
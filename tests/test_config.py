@@ -0,0 +1,33 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2025 Thingenious.
+"""Test the application settings."""
+
+# pylint: disable=missing-return-doc,missing-param-doc,missing-yield-doc
+# pylint: disable=missing-function-docstring
+
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from eva.config import Settings
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "valid"),
+    [
+        ({"eva_workers": 2}, False),
+        ({"eva_workers": 2, "chroma_local": False}, True),
+    ],
+    ids=["local_chroma", "remote_chroma"],
+)
+def test_several_workers_need_remote_chroma(
+    monkeypatch: pytest.MonkeyPatch, kwargs: dict[str, Any], valid: bool
+) -> None:
+    """Test that several workers cannot share the local ChromaDB."""
+    monkeypatch.delenv("CHROMA_LOCAL", raising=False)
+    if valid:
+        assert Settings(**kwargs).eva_workers == 2
+    else:
+        with pytest.raises(ValidationError, match="EVA_WORKERS"):
+            Settings(**kwargs)
@@ -2,13 +2,13 @@
 # Copyright (c) 2024 - 2025 Thingenious.
 
 """Test main application functionality with WebSocket support."""
+# mypy: disable-error-code="method-assign"
 # pylint: disable=missing-return-doc,missing-param-doc,missing-yield-doc
 # pylint: disable=missing-function-docstring,unused-argument
 
-import asyncio
 import os
 from typing import Any, AsyncGenerator
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock
 
 import httpx
 import pytest
@@ -16,64 +16,107 @@ from httpx_ws import aconnect_ws
 from httpx_ws._exceptions import WebSocketDisconnect
 from httpx_ws.transport import ASGIWebSocketTransport
 
-from eva.main import create_app
+from eva.main import EvaApp
 from eva.models import ChatMessage
 
+_API_KEY = os.getenv("CHAT_API_KEY", "super-secret")
+
+
+@pytest.fixture(name="api_key")
+def api_key_fixture(monkeypatch: pytest.MonkeyPatch) -> str:
+    """Set the chat API key the tests connect with."""
+    monkeypatch.setattr("eva.main.settings.chat_api_key", _API_KEY)
+    return _API_KEY
+
+
+@pytest.fixture(name="ws_client", scope="module")
+def ws_client_fixture(base_app: EvaApp) -> httpx.AsyncClient:
+    """Create one WebSocket capable client for the shared application."""
+    # not closed: there are no sockets to release, and closing the
+    # transport would exit the last connection in another task
+    return httpx.AsyncClient(transport=ASGIWebSocketTransport(base_app))
+
+
+@pytest.fixture(name="mocked_app")
+def mocked_app_fixture(
+    base_app: EvaApp,
+    mock_managers: tuple[MagicMock, MagicMock, MagicMock],
+    monkeypatch: pytest.MonkeyPatch,
+) -> EvaApp:
+    """Attach mocked LLM, RAG and DB managers to the shared application."""
+    llm, rag, db = mock_managers
+    # restored (or removed) after each test
+    monkeypatch.setattr(base_app, "llm_manager", llm, raising=False)
+    monkeypatch.setattr(base_app, "rag_manager", rag, raising=False)
+    monkeypatch.setattr(base_app, "db_manager", db, raising=False)
+    return base_app
+
 
 @pytest.mark.asyncio
-async def test_websocket_with_query() -> None:
+async def test_websocket_with_query(
+    ws_client: httpx.AsyncClient, api_key: str
+) -> None:
     """Test that the WebSocket connection works as expected."""
-    api_key = os.getenv("CHAT_API_KEY", "super-secret")
-    app = create_app()
-    with patch("eva.main.settings.chat_api_key", api_key):
-        async with httpx.AsyncClient(
-            transport=ASGIWebSocketTransport(app)
-        ) as client:
-            async with aconnect_ws(
-                f"http://server/ws?token={api_key}",
-                client,
-            ):
-                pass
-            with pytest.raises(WebSocketDisconnect):
-                async with aconnect_ws(
-                    "http://server/ws?token=invalid_token",
-                    client,
-                ):
-                    pass
+    async with aconnect_ws(
+        f"http://server/ws?token={api_key}",
+        ws_client,
+    ):
+        pass
+    with pytest.raises(WebSocketDisconnect):
+        async with aconnect_ws(
+            "http://server/ws?token=invalid_token",
+            ws_client,
+        ):
+            pass
 
 
 @pytest.mark.asyncio
-async def test_websocket_with_subprotocol() -> None:
+async def test_websocket_with_subprotocol(
+    ws_client: httpx.AsyncClient, api_key: str
+) -> None:
     """Test that the WebSocket connection works with subprotocols."""
-    api_key = os.getenv("CHAT_API_KEY", "super-secret")
-    app = create_app()
-    with patch("eva.main.settings.chat_api_key", api_key):
-        async with httpx.AsyncClient(
-            transport=ASGIWebSocketTransport(app)
-        ) as client:
-            async with aconnect_ws(
-                "http://server/ws",
-                client,
-                subprotocols=["token", api_key],
-            ):
-                pass
-            with pytest.raises(WebSocketDisconnect):
-                async with aconnect_ws(
-                    "http://server/ws",
-                    client,
-                    subprotocols=["token", "invalid_token"],
-                ):
-                    pass
+    async with aconnect_ws(
+        "http://server/ws",
+        ws_client,
+        subprotocols=["token", api_key],
+    ):
+        pass
+    with pytest.raises(WebSocketDisconnect):
+        async with aconnect_ws(
+            "http://server/ws",
+            ws_client,
+            subprotocols=["token", "invalid_token"],
+        ):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_websocket_rejects_when_busy(
+    base_app: EvaApp,
+    ws_client: httpx.AsyncClient,
+    api_key: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that connections over the configured limit are rejected."""
+    monkeypatch.setattr("eva.main.settings.max_ws_connections", 0)
+    rejected = base_app.rejected_connections
+    with pytest.raises(WebSocketDisconnect) as exc_info:
+        async with aconnect_ws(
+            f"http://server/ws?token={api_key}",
+            ws_client,
+        ):
+            pass
+    # try again later, not an authentication failure (1008)
+    assert exc_info.value.code == 1013
+    assert base_app.rejected_connections == rejected + 1
 
 
 @pytest.mark.asyncio
-async def test_websocket_chat_with_managers_mocked() -> None:
+async def test_websocket_chat_with_managers_mocked(
+    mocked_app: EvaApp, ws_client: httpx.AsyncClient, api_key: str
+) -> None:
     """Test the WebSocket chat functionality with mocked managers."""
-    # -- create app instance
-    app = create_app()
 
-    # -- Create Mocks (LLM, RAG, DB)
-    # Mock for llm_manager.generate_response
     async def fake_llm_response(
         *args: Any, **kwargs: Any
     ) -> AsyncGenerator[ChatMessage, None]:
@@ -88,148 +131,71 @@ async def test_websocket_chat_with_managers_mocked() -> None:
                 metadata={"sources": ["source1"]},
                 is_final=True,
             )
-            # Simulate a delay for streaming response
-            await asyncio.sleep(0.1)
 
         return generate()
 
-    mock_llm = MagicMock()
-    mock_llm.generate_response = fake_llm_response
-    mock_llm.summarize_conversation = AsyncMock(return_value="A summary.")
-    mock_llm.initialize = AsyncMock()
-    mock_llm.close = AsyncMock()
-
-    # Mock for rag_manager.search
-    mock_rag = MagicMock()
-    mock_rag.search = AsyncMock(
-        return_value=[
-            {"content": "France is a country in Europe.", "id": "source1"},
-        ]
-    )
-    mock_rag.initialize = AsyncMock()
-
-    # Mock for db_manager (minimal, just conversation CRUD)
-    mock_db = MagicMock()
-    mock_db.get_admin_setting = AsyncMock(
-        return_value="You are a helpful assistant."
-    )
-    mock_db.create_conversation = AsyncMock(return_value="conv123")
-    mock_db.save_message = AsyncMock()
-    mock_db.get_conversation_messages = AsyncMock(
-        return_value=[
-            {"role": "user", "content": "What's the capital of France?"},
-        ]
-    )
-    mock_db.get_latest_summary = AsyncMock(return_value=None)
-    mock_db.save_summary = AsyncMock()
-    mock_db.init_db = AsyncMock()
-    mock_db.close = AsyncMock()
-
-    # Patch them in the EvaApp instance
-    app.llm_manager = mock_llm
-    app.rag_manager = mock_rag
-    app.db_manager = mock_db
-
-    # --- run the websocket test ---
-    api_key = "super-secret"
-    with patch("eva.main.settings.chat_api_key", api_key):
-        async with httpx.AsyncClient(
-            transport=ASGIWebSocketTransport(app)
-        ) as client:
-            async with aconnect_ws(  # type: ignore
-                f"http://server/ws?token={api_key}",
-                client,
-            ) as ws:
-                # Start conversation
-                await ws.send_json({"type": "start_conversation"})
-                started = await ws.receive_json()
-                assert started["type"] == "conversation_started"
-                conv_id = started["conversation_id"]
-                assert conv_id == "conv123"
-
-                # User sends message
-                await ws.send_json(
-                    {
-                        "type": "user_message",
-                        "conversation_id": conv_id,
-                        "content": "What's the capital of France?",
-                    }
-                )
-
-                # Assistant responds
-                response = await ws.receive_json()
-                assert response["type"] == "message"
-                assert response["content"] == "Paris is the capital of France."
-                assert response["emotion"] == "confident"
-                assert response["metadata"]["sources"] == ["source1"]
-                assert response["is_final"] is True
+    mocked_app.llm_manager.generate_response = fake_llm_response
+    async with aconnect_ws(  # type: ignore
+        f"http://server/ws?token={api_key}",
+        ws_client,
+    ) as ws:
+        # Start conversation
+        await ws.send_json({"type": "start_conversation"})
+        started = await ws.receive_json()
+        assert started["type"] == "conversation_started"
+        conv_id = started["conversation_id"]
+        assert conv_id == "conv123"
+
+        # User sends message
+        await ws.send_json(
+            {
+                "type": "user_message",
+                "conversation_id": conv_id,
+                "content": "What's the capital of France?",
+            }
+        )
+
+        # Assistant responds
+        response = await ws.receive_json()
+        assert response["type"] == "message"
+        assert response["content"] == "Paris is the capital of France."
+        assert response["emotion"] == "confident"
+        assert response["metadata"]["sources"] == ["source1"]
+        assert response["is_final"] is True
 
 
 @pytest.mark.asyncio
-async def test_websocket_chat_handles_llm_error() -> None:
+async def test_websocket_chat_handles_llm_error(
+    mocked_app: EvaApp, ws_client: httpx.AsyncClient, api_key: str
+) -> None:
     """Test WebSocket chat functionality when LLM raises an error."""
-    app = create_app()
 
-    # Setup as before, but this time cause
-    # llm_manager.generate_response to raise
     async def raise_error(
         *args: Any, **kwargs: Any
     ) -> AsyncGenerator[ChatMessage, None]:
         raise RuntimeError("LLM broke")
 
-    mock_llm = MagicMock()
-    mock_llm.generate_response = raise_error
-    mock_llm.summarize_conversation = AsyncMock(return_value="A summary.")
-    mock_llm.initialize = AsyncMock()
-    mock_llm.close = AsyncMock()
-
-    # Keep the other mocks as before
-    mock_rag = MagicMock()
-    mock_rag.search = AsyncMock(
-        return_value=[{"content": "irrelevant", "id": "src"}]
-    )
-    mock_rag.initialize = AsyncMock()
-    mock_db = MagicMock()
-    mock_db.create_conversation = AsyncMock(return_value="conv123")
-    mock_db.save_message = AsyncMock()
-    mock_db.get_conversation_messages = AsyncMock(
-        return_value=[
-            {"role": "user", "content": "What's the capital of France?"},
-        ]
-    )
-    mock_db.get_latest_summary = AsyncMock(return_value=None)
-    mock_db.save_summary = AsyncMock()
-    mock_db.init_db = AsyncMock()
-    mock_db.close = AsyncMock()
-    app.llm_manager = mock_llm
-    app.rag_manager = mock_rag
-    app.db_manager = mock_db
-
-    api_key = "super-secret"
-    with patch("eva.main.settings.chat_api_key", api_key):
-        async with httpx.AsyncClient(
-            transport=ASGIWebSocketTransport(app)
-        ) as client:
-            async with aconnect_ws(  # type: ignore
-                f"http://server/ws?token={api_key}",
-                client,
-            ) as ws:
-                await ws.send_json({"type": "start_conversation"})
-                started = await ws.receive_json()
-                assert started["type"] == "conversation_started"
-                conv_id = started["conversation_id"]
-                # Now, send a user message that will trigger LLM error
-                await ws.send_json(
-                    {
-                        "type": "user_message",
-                        "conversation_id": conv_id,
-                        "content": "break please",
-                    }
-                )
-                # Should receive an error message from the server
-                resp = await ws.receive_json()
-                assert resp["type"] == "error"
-                assert (
-                    "LLM broke" in resp["content"]
-                    or "Error processing your message" in resp["content"]
-                )
+    mocked_app.llm_manager.generate_response = raise_error
+    async with aconnect_ws(  # type: ignore
+        f"http://server/ws?token={api_key}",
+        ws_client,
+    ) as ws:
+        await ws.send_json({"type": "start_conversation"})
+        started = await ws.receive_json()
+        assert started["type"] == "conversation_started"
+        conv_id = started["conversation_id"]
+        # Now, send a user message that will trigger LLM error
+        await ws.send_json(
+            {
+                "type": "user_message",
+                "conversation_id": conv_id,
+                "content": "break please",
+            }
+        )
+        # Should receive an error message from the server
+        resp = await ws.receive_json()
+        assert resp["type"] == "error"
+        assert (
+            "LLM broke" in resp["content"]
+            or "Error processing your message" in resp["content"]
+        )